@@ -2,8 +2,23 @@
 import sys
 import time
 import subprocess
+from collections import deque
+from itertools import islice
 from pywinauto import Desktop
 
+
+def iter_descendants(ctrl):
+    """Yield descendants breadth-first so callers can stop early without
+    paying for a full UIA tree walk"""
+    queue = deque(ctrl.children())
+    while queue:
+        child = queue.popleft()
+        yield child
+        try:
+            queue.extend(child.children())
+        except Exception:
+            pass
+
 # Open Control Panel
 subprocess.Popen("control", shell=True)
 print("Waiting for Control Panel to open...")
@@ -53,7 +68,7 @@ if control_panel:
     print("\n" + "="*50)
     print("All descendants (first 50):")
     try:
-        for i, child in enumerate(control_panel.descendants()[:50]):
+        for i, child in enumerate(islice(iter_descendants(control_panel), 50)):
             try:
                 text = child.window_text()
                 ctype = child.element_info.control_type
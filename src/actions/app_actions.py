@@ -6,33 +6,157 @@ import subprocess
 import psutil
 import os
 import json
+import time
+import atexit
+import shutil
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Dict
 
 
+@functools.lru_cache(maxsize=32)
+def _is_valid_root(path: str) -> bool:
+    """Check (and cache) whether a search root directory exists"""
+    return os.path.isdir(path)
+
+
 class AppActions:
     """Handles application launching and control with smart executable detection"""
 
+    # How long a failed lookup stays cached before we re-scan the disk
+    NEGATIVE_CACHE_TTL = 300  # seconds
+
+    # How long a process-table snapshot stays fresh before re-enumeration
+    PROC_CACHE_TTL = 1.0  # seconds
+
+    # How long the executable manifest stays fresh before a rebuild
+    EXE_INDEX_TTL = 24 * 3600  # seconds
+
+    # cmd.exe built-in verbs that cannot be spawned directly
+    SHELL_BUILTINS = {"start", "dir", "cd"}
+
     def __init__(self):
         """Initialize with cache for found executables"""
         self.cache_file = Path(__file__).parent.parent.parent / 'config' / 'app_cache.json'
         self.app_cache = self._load_cache()
+        # Cache writes are deferred: discoveries mark the cache dirty and the
+        # file is rewritten once at exit instead of on every hit
+        self._cache_dirty = False
+        atexit.register(self._flush_cache)
+        # Short-lived process-table snapshot: (timestamp, app list, name set)
+        self._proc_cache = (0.0, [], frozenset())
+        # pid -> username cache; the LSA lookup behind username() is slow on
+        # Windows and pids rarely change between snapshots
+        self._pid_users = {}
+        # Manifest of exe name -> path built by scanning the search roots,
+        # loaded lazily and rebuilt in the background when stale
+        self.exe_index_file = Path(__file__).parent.parent.parent / 'config' / 'exe_index.json'
+        self._exe_index = None
+        self._index_thread = None
+        # Resolve environment-derived search roots once instead of re-reading
+        # os.environ on every lookup
+        self._search_roots = tuple(p for p in (
+            os.environ.get('LOCALAPPDATA'),
+            os.environ.get('PROGRAMFILES'),
+            os.environ.get('PROGRAMFILES(X86)'),
+        ) if p)
 
     def _load_cache(self) -> dict:
         """Load cached application paths"""
         if self.cache_file.exists():
             try:
                 with open(self.cache_file, 'r') as f:
-                    return json.load(f)
+                    cache = json.load(f)
+                # Migrate legacy entries (plain path strings) to the
+                # {path, ts} dict format used for negative caching
+                for key, value in cache.items():
+                    if isinstance(value, str):
+                        cache[key] = {'path': value, 'ts': time.time()}
+                return cache
             except:
                 pass
         return {}
 
     def _save_cache(self):
-        """Save application paths to cache"""
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.app_cache, f, indent=2)
+        """Mark the cache dirty; the file is written by _flush_cache"""
+        self._cache_dirty = True
+
+    def _flush_cache(self):
+        """Write the cache to disk if anything changed since the last flush"""
+        if not self._cache_dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w') as f:
+                json.dump(self.app_cache, f, separators=(',', ':'))
+            self._cache_dirty = False
+        except OSError:
+            pass
+
+    def _get_exe_index(self) -> dict:
+        """
+        Get the exe name -> path manifest, scheduling a background rebuild
+        when it is missing or older than EXE_INDEX_TTL
+
+        Returns:
+            Dict mapping lowercased exe names to full paths (may be empty)
+        """
+        if self._exe_index is None and self.exe_index_file.exists():
+            try:
+                with open(self.exe_index_file, 'r') as f:
+                    self._exe_index = json.load(f)
+            except:
+                pass
+
+        data = self._exe_index
+        if data is None or time.time() - data.get('ts', 0) > self.EXE_INDEX_TTL:
+            self._schedule_index_rebuild()
+        return (data or {}).get('exes', {})
+
+    def _schedule_index_rebuild(self):
+        """Rebuild the manifest in a daemon thread so lookups never block"""
+        if self._index_thread is not None and self._index_thread.is_alive():
+            return
+        self._index_thread = threading.Thread(target=self._build_executable_index, daemon=True)
+        self._index_thread.start()
+
+    def _build_executable_index(self):
+        """Scan all search roots (app dirs one level deep) for executables"""
+        exes = {}
+        for root in self._search_roots:
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                if entry.name.lower().endswith('.exe'):
+                                    exes.setdefault(entry.name.lower(), entry.path)
+                            elif entry.is_dir(follow_symlinks=False):
+                                self._scan_dir_for_exes(entry.path, exes)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        self._exe_index = {'ts': time.time(), 'exes': exes}
+        try:
+            self.exe_index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.exe_index_file, 'w') as f:
+                json.dump(self._exe_index, f, separators=(',', ':'))
+        except OSError:
+            pass
+
+    def _scan_dir_for_exes(self, path: str, exes: dict):
+        """Record top-level .exe files found in one install directory"""
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.exe'):
+                        exes.setdefault(entry.name.lower(), entry.path)
+        except OSError:
+            pass
 
     def _find_executable(self, app_name: str) -> Optional[str]:
         """
@@ -46,13 +170,19 @@ class AppActions:
         """
         import sys
 
-        # Check cache first
+        # Check cache first (entries are {path, ts}; path is None when a
+        # previous search already failed)
         cache_key = app_name.lower()
         if cache_key in self.app_cache:
-            cached_path = self.app_cache[cache_key]
-            if os.path.exists(cached_path):
-                print(f"[SMART LAUNCH] Found {app_name} in cache: {cached_path}", file=sys.stderr)
-                return cached_path
+            entry = self.app_cache[cache_key]
+            cached_path = entry.get('path')
+            if cached_path:
+                if os.path.exists(cached_path):
+                    print(f"[SMART LAUNCH] Found {app_name} in cache: {cached_path}", file=sys.stderr)
+                    return cached_path
+            elif time.time() - entry.get('ts', 0) < self.NEGATIVE_CACHE_TTL:
+                print(f"[SMART LAUNCH] {app_name} known missing (cached), skipping search", file=sys.stderr)
+                return None
 
         print(f"[SMART LAUNCH] Searching for {app_name}...", file=sys.stderr)
 
@@ -61,33 +191,64 @@ class AppActions:
             exe_name = f"{app_name}.exe"
         else:
             exe_name = app_name
-
-        # Common search locations
-        search_paths = [
-            os.path.join(os.environ.get('LOCALAPPDATA', ''), app_name.title()),
-            os.path.join(os.environ.get('LOCALAPPDATA', ''), app_name),
-            os.path.join(os.environ.get('PROGRAMFILES', ''), app_name.title()),
-            os.path.join(os.environ.get('PROGRAMFILES', ''), app_name),
-            os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), app_name.title()),
-            os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), app_name),
-        ]
-
-        # Search in common locations
-        for search_path in search_paths:
-            if os.path.exists(search_path):
-                for root, dirs, files in os.walk(search_path):
-                    for file in files:
-                        if file.lower() == exe_name.lower():
-                            full_path = os.path.join(root, file)
-                            print(f"[SMART LAUNCH] Found executable: {full_path}", file=sys.stderr)
-                            # Cache the result
-                            self.app_cache[cache_key] = full_path
-                            self._save_cache()
-                            return full_path
-                    # Only search top level to avoid slow deep searches
-                    break
+        exe_lower = exe_name.lower()
+
+        # Consult the prebuilt manifest first - a dict hit skips all
+        # directory scanning
+        indexed = self._get_exe_index().get(exe_lower)
+        if indexed and os.path.exists(indexed):
+            print(f"[SMART LAUNCH] Found {app_name} in exe index: {indexed}", file=sys.stderr)
+            self.app_cache[cache_key] = {'path': indexed, 'ts': time.time()}
+            self._save_cache()
+            return indexed
+
+        # Common search locations (deduplicated - .title() and original name
+        # are often the same path on Windows' case-insensitive filesystem)
+        search_paths = list(dict.fromkeys(
+            os.path.join(root, variant)
+            for root in self._search_roots
+            for variant in (app_name.title(), app_name)
+        ))
+
+        def _scan_one(search_path: str) -> Optional[str]:
+            """Scan one directory's top level for the target executable"""
+            if not _is_valid_root(search_path):
+                return None
+            try:
+                with os.scandir(search_path) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False) and entry.name.lower() == exe_lower:
+                            return entry.path
+            except OSError:
+                pass
+            return None
+
+        # Scan the locations concurrently - each can hit cold directory I/O,
+        # so overlapping the waits beats a serial walk; stop at first hit
+        full_path = None
+        if search_paths:
+            with ThreadPoolExecutor(max_workers=len(search_paths)) as pool:
+                futures = [pool.submit(_scan_one, p) for p in search_paths]
+                for future in as_completed(futures):
+                    found = future.result()
+                    if found:
+                        full_path = found
+                        for other in futures:
+                            other.cancel()
+                        break
+
+        if full_path:
+            print(f"[SMART LAUNCH] Found executable: {full_path}", file=sys.stderr)
+            # Cache the result
+            self.app_cache[cache_key] = {'path': full_path, 'ts': time.time()}
+            self._save_cache()
+            return full_path
 
         print(f"[SMART LAUNCH] Executable not found for {app_name}", file=sys.stderr)
+        # Negative-cache the miss so repeated failed lookups don't re-scan
+        # every search root until the TTL expires
+        self.app_cache[cache_key] = {'path': None, 'ts': time.time()}
+        self._save_cache()
         return None
 
     # No hardcoded mappings - GPT will dynamically determine the correct command
@@ -103,26 +264,48 @@ class AppActions:
         Returns:
             Success message
         """
-        # Normalize app name
-        app_name_lower = app_name.lower()
+        # Delegate to launch_app, which handles PATH resolution and smart
+        # detection (the old hardcoded KNOWN_APPS mapping is gone)
+        return self.launch_app(app_name, " ".join(args) if args else None)
 
-        # Check if it's a known app
-        if app_name_lower in self.KNOWN_APPS:
-            executable = self.KNOWN_APPS[app_name_lower]
-        elif app_name.endswith('.exe'):
-            executable = app_name
-        else:
-            executable = f"{app_name}.exe"
-
-        # Build command
-        cmd = [executable]
-        if args:
-            cmd.extend(args)
-
-        # Launch the application
-        process = subprocess.Popen(cmd)
+    def _process_snapshot(self) -> tuple:
+        """
+        Get a cached snapshot of the process table
 
-        return f"Launched {app_name} (PID: {process.pid})"
+        Returns:
+            (apps, names) - list of app info dicts and frozenset of
+            lowercased process names; refreshed when older than PROC_CACHE_TTL
+        """
+        ts, apps, names = self._proc_cache
+        if time.monotonic() - ts > self.PROC_CACHE_TTL:
+            apps = []
+            seen_pids = set()
+            for process in psutil.process_iter(['pid', 'name']):
+                try:
+                    info = process.info
+                    pid = info['pid']
+                    seen_pids.add(pid)
+                    # Only resolve the username for pids we haven't seen yet
+                    user = self._pid_users.get(pid)
+                    if user is None:
+                        try:
+                            user = process.username() or 'unknown'
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            user = 'unknown'
+                        self._pid_users[pid] = user
+                    apps.append({
+                        'pid': pid,
+                        'name': info['name'],
+                        'user': user
+                    })
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            # Forget usernames of processes that have exited
+            if len(self._pid_users) > len(seen_pids):
+                self._pid_users = {pid: u for pid, u in self._pid_users.items() if pid in seen_pids}
+            names = frozenset((app['name'] or '').lower() for app in apps)
+            self._proc_cache = (time.monotonic(), apps, names)
+        return apps, names
 
     def is_app_running(self, app_name: str) -> bool:
         """
@@ -138,14 +321,8 @@ class AppActions:
         if not app_name.endswith('.exe'):
             app_name = f"{app_name}.exe"
 
-        for process in psutil.process_iter(['name']):
-            try:
-                if process.info['name'].lower() == app_name:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-
-        return False
+        _, names = self._process_snapshot()
+        return app_name in names
 
     def list_running_apps(self) -> List[Dict]:
         """
@@ -154,19 +331,7 @@ class AppActions:
         Returns:
             List of dicts with app info
         """
-        apps = []
-
-        for process in psutil.process_iter(['pid', 'name', 'username']):
-            try:
-                info = process.info
-                apps.append({
-                    'pid': info['pid'],
-                    'name': info['name'],
-                    'user': info.get('username', 'unknown')
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-
+        apps, _ = self._process_snapshot()
         return apps
 
     def launch_app(self, command: str, args: Optional[str] = None) -> str:
@@ -193,12 +358,49 @@ class AppActions:
         # Log what we're executing
         print(f"[LAUNCH] Attempting: {full_command}", file=sys.stderr)
 
-        # Try launching directly first (NON-BLOCKING)
+        # Launch without waiting - Windows DETACHED_PROCESS flag
+        DETACHED_PROCESS = 0x00000008
+        CREATE_NEW_PROCESS_GROUP = 0x00000200
+
+        # Shell verbs ('start excel') and URI launches (ms-settings:...)
+        # genuinely need cmd.exe; everything else can spawn directly
+        first_token = command.split()[0].lower() if command.split() else ""
+        needs_shell = (
+            first_token in self.SHELL_BUILTINS
+            or (':' in first_token and '\\' not in first_token and '/' not in first_token
+                and not first_token.endswith('.exe'))
+        )
+
+        # Fast path: resolve via PATH or smart detection and spawn the exe
+        # directly - no cmd.exe in the middle and no 200ms failure probe
+        # (Popen raises synchronously if the binary is missing)
+        resolved = None
+        via_detection = False
+        if not needs_shell:
+            resolved = shutil.which(command)
+            if not resolved:
+                resolved = self._find_executable(command)
+                via_detection = resolved is not None
+        if resolved:
+            try:
+                subprocess.Popen(
+                    [resolved] + (args.split() if args else []),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    stdin=subprocess.DEVNULL,
+                    close_fds=True,
+                    creationflags=DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+                )
+                print(f"[LAUNCH] Successfully launched: {full_command}", file=sys.stderr)
+                if via_detection:
+                    return f"✓ Launched {command} (auto-detected at: {resolved})"
+                return f"✓ Launched: {command}"
+            except OSError as e:
+                print(f"[LAUNCH] Direct spawn failed: {e} - falling back to shell", file=sys.stderr)
+
+        # Shell path: needed for cmd built-ins ('start excel'), URIs and
+        # anything not resolvable - keep the short poll to detect failure
         try:
-            # Launch without waiting - Windows DETACHED_PROCESS flag
-            DETACHED_PROCESS = 0x00000008
-            CREATE_NEW_PROCESS_GROUP = 0x00000200
-
             process = subprocess.Popen(
                 full_command,
                 shell=True,
@@ -213,9 +415,14 @@ class AppActions:
             poll_result = process.poll()
 
             if poll_result is not None and poll_result != 0:
-                # Process ended with error - check stderr
+                # Process ended with error - drain stderr and reap it fully
+                # (a blocking read could hang if anything still holds the pipe)
                 try:
-                    stderr = process.stderr.read().decode('utf-8', errors='ignore')
+                    _, stderr_bytes = process.communicate(timeout=0.1)
+                    stderr = stderr_bytes.decode('utf-8', errors='ignore') if stderr_bytes else ""
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    stderr = ""
                 except:
                     stderr = ""
 
@@ -2,17 +2,48 @@
 File-related action handlers
 """
 
+import errno
+import fnmatch
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Optional, List, Dict
-from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (skip the insert when a
+# caller already set it up - repeated inserts lengthen every import's
+# search path for the rest of the process)
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 from utils import expand_path
 
+# Spawn helper processes without allocating a console window
+CREATE_NO_WINDOW = 0x08000000
+
+# Timestamp format for file listings - time.strftime over a struct_time
+# skips the datetime allocation that fromtimestamp().isoformat() pays
+# per file, which adds up over multi-thousand-entry listings
+_ISO_FMT = '%Y-%m-%dT%H:%M:%S'
+
+
+def _blake2b_digest(fileobj) -> bytes:
+    """
+    BLAKE2b digest of an open binary file
+
+    hashlib.file_digest only exists on Python 3.11+; on 3.10 (the
+    documented minimum) fall back to a chunked update loop.
+    """
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(fileobj, 'blake2b').digest()
+    digest = hashlib.blake2b()
+    for chunk in iter(lambda: fileobj.read(1024 * 1024), b''):
+        digest.update(chunk)
+    return digest.digest()
+
 
 class FileActions:
     """Handles file and folder operations"""
@@ -35,8 +66,9 @@ class FileActions:
         if not os.path.isdir(path):
             raise NotADirectoryError(f"Path is not a directory: {path}")
 
-        # Open folder in Windows Explorer
-        subprocess.run(['explorer', path], check=True)
+        # Open folder via ShellExecuteW - returns immediately, and skips
+        # check=True since explorer reports non-zero even on success
+        os.startfile(path)
 
         return f"Opened folder: {path}"
 
@@ -69,13 +101,18 @@ class FileActions:
         if not path.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {path}")
 
-        # Search for files
-        if recursive:
-            files = list(path.rglob(pattern))
+        # Search for files - matches stream out of _iter_matches with their
+        # stat results already cached, so no file is stat'd twice
+        if latest:
+            # Single pass max() instead of materializing and sorting
+            best = max(self._iter_matches(path, pattern, recursive),
+                       key=lambda match: match[1].st_mtime, default=None)
+            matches = [best] if best else []
         else:
-            files = list(path.glob(pattern))
+            matches = sorted(self._iter_matches(path, pattern, recursive),
+                             key=lambda match: match[1].st_mtime, reverse=True)
 
-        if not files:
+        if not matches:
             return {
                 'found': False,
                 'count': 0,
@@ -83,18 +120,14 @@ class FileActions:
                 'message': f'No files matching "{pattern}" found in {path}'
             }
 
-        # Sort by modification time (newest first)
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-        # Prepare file info
+        # Prepare file info from the cached stat results
         file_info = []
-        for f in files:
-            stat = f.stat()
+        for file_path, stat in matches:
             file_info.append({
-                'path': str(f),
-                'name': f.name,
+                'path': file_path,
+                'name': os.path.basename(file_path),
                 'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+                'modified': time.strftime(_ISO_FMT, time.localtime(stat.st_mtime))
             })
 
         if latest:
@@ -106,10 +139,7 @@ class FileActions:
             }
             # Show the file in Explorer if requested
             if show_in_explorer and file_info:
-                file_path = file_info[0]['path']
-                # Use explorer /select to open and highlight the file
-                # Don't check return code as it may return 1 even on success in some environments
-                subprocess.run(f'explorer /select,"{file_path}"', shell=True)
+                self._select_in_explorer(file_info[0]['path'])
                 result['message'] += ' (Opened in Explorer)'
         else:
             result = {
@@ -120,14 +150,64 @@ class FileActions:
             }
             # Show the first file in Explorer if requested
             if show_in_explorer and file_info:
-                file_path = file_info[0]['path']
-                # Use explorer /select to open and highlight the file
-                # Don't check return code as it may return 1 even on success in some environments
-                subprocess.run(f'explorer /select,"{file_path}"', shell=True)
+                self._select_in_explorer(file_info[0]['path'])
                 result['message'] += ' (Opened first file in Explorer)'
 
         return result
 
+    def _select_in_explorer(self, file_path: str):
+        """
+        Open Explorer with the given file highlighted (fire-and-forget)
+
+        Spawns explorer directly from an argument list - no cmd.exe
+        intermediary, no quoting concerns - and doesn't wait for it:
+        explorer often returns non-zero even on success, and the caller
+        has no use for its exit status.
+        """
+        try:
+            subprocess.Popen(
+                ["explorer", f"/select,{file_path}"],
+                creationflags=CREATE_NO_WINDOW,
+                close_fds=True
+            )
+        except OSError:
+            # Highlighting is best-effort - the find result still stands
+            pass
+        except ValueError:
+            # creationflags is Windows-only; nothing to show elsewhere
+            pass
+
+    def _iter_matches(self, root: Path, pattern: str, recursive: bool):
+        """
+        Yield (path, stat) for files under root whose name matches pattern
+
+        Walks with os.scandir so directory-entry type checks come from the
+        listing itself and each DirEntry.stat() is served from its cache -
+        one stat per matching file instead of one per entry plus one per
+        sort key.
+
+        Args:
+            root: Directory to search in
+            pattern: fnmatch-style file pattern
+            recursive: Descend into subdirectories
+
+        Yields:
+            (path, stat_result) tuples for matching files
+        """
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                            yield entry.path, entry.stat()
+            except PermissionError:
+                continue
+
     def create_file(self, path: str, content: str, overwrite: bool = False) -> str:
         """
         Create a new text file
@@ -149,11 +229,29 @@ class FileActions:
         # Create parent directories if needed
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write file - large payloads go through a single raw os.write,
+        # skipping the buffered text layer's copy passes; small ones keep
+        # the plain open() where setup cost doesn't matter
+        char_count = len(content)
+        if char_count > 64 * 1024:
+            # Match text-mode newline translation so the bytes on disk
+            # don't depend on which side of the threshold the content lands
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            data = content.encode('utf-8')
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            if not overwrite:
+                flags |= os.O_EXCL
+            fd = os.open(path, flags, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
 
-        return f"Created file: {path} ({len(content)} characters)"
+        return f"Created file: {path} ({char_count} characters)"
 
     def open_file(self, path: str) -> str:
         """
@@ -193,9 +291,7 @@ class FileActions:
         if not path.exists():
             raise FileNotFoundError(f"File does not exist: {path}")
 
-        # Use explorer /select to open Explorer and highlight the file
-        # Don't check return code as it may return 1 even on success in some environments
-        subprocess.run(f'explorer /select,"{str(path)}"', shell=True)
+        self._select_in_explorer(str(path))
 
         return f"Opened Explorer and highlighted: {path.name}"
 
@@ -218,18 +314,21 @@ class FileActions:
         if not path.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {path}")
 
+        # scandir's is_file comes from the directory listing itself and
+        # DirEntry.stat() is memoized - one syscall per file, not two
         files = []
-        for item in path.iterdir():
-            if item.is_file():
-                if details:
-                    stat = item.stat()
-                    files.append({
-                        'name': item.name,
-                        'size': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
-                else:
-                    files.append(item.name)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if details:
+                        stat = entry.stat()
+                        files.append({
+                            'name': entry.name,
+                            'size': stat.st_size,
+                            'modified': time.strftime(_ISO_FMT, time.localtime(stat.st_mtime))
+                        })
+                    else:
+                        files.append(entry.name)
 
         return {
             'path': str(path),
@@ -249,8 +348,6 @@ class FileActions:
         Returns:
             Success message
         """
-        import shutil
-
         source = Path(expand_path(source))
         destination = Path(expand_path(destination))
 
@@ -265,17 +362,64 @@ class FileActions:
             destination = destination / source.name
 
         # Check if destination exists
-        if destination.exists() and not overwrite:
-            raise FileExistsError(f"Destination already exists: {destination}. Use overwrite=True to replace.")
+        if destination.exists():
+            if not overwrite:
+                raise FileExistsError(f"Destination already exists: {destination}. Use overwrite=True to replace.")
+            # Idempotent-sync short-circuit: identical size and BLAKE2b
+            # digest means there is nothing to write
+            if source.stat().st_size == destination.stat().st_size:
+                with open(source, 'rb') as src, open(destination, 'rb') as dst:
+                    if _blake2b_digest(src) == _blake2b_digest(dst):
+                        return f"Skipped copy: '{destination}' already matches '{source.name}'"
 
         # Create parent directories if needed
         destination.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy the file
-        shutil.copy2(source, destination)
+        # Copy the data through the fastest kernel path available and carry
+        # over the timestamps; skipping copy2's extra permission-bit work
+        # saves a stat/chmod pair per copy
+        self._fast_copy(source, destination)
+        source_stat = source.stat()
+        os.utime(destination, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
 
         return f"Copied '{source.name}' to '{destination}'"
 
+    def _fast_copy(self, source: Path, destination: Path):
+        """
+        Copy file bytes via the fastest available kernel path
+
+        On Windows, hands the whole job to CopyFileExW - one kernel call
+        instead of a Python read/write loop. On Linux, os.copy_file_range
+        lets same-filesystem copies happen server-side (reflink on
+        btrfs/xfs). Falls back to shutil.copyfile when neither applies.
+
+        Args:
+            source: Source file path
+            destination: Destination file path
+        """
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                if ctypes.windll.kernel32.CopyFileExW(
+                        str(source), str(destination), None, None, None, 0):
+                    return
+            except Exception:
+                pass
+        elif hasattr(os, 'copy_file_range'):
+            try:
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return
+            except OSError:
+                pass
+        shutil.copyfile(source, destination)
+
     def move_file(self, source: str, destination: str, overwrite: bool = False) -> str:
         """
         Move a file from source to destination
@@ -288,8 +432,6 @@ class FileActions:
         Returns:
             Success message
         """
-        import shutil
-
         source = Path(expand_path(source))
         destination = Path(expand_path(destination))
 
@@ -310,8 +452,14 @@ class FileActions:
         # Create parent directories if needed
         destination.parent.mkdir(parents=True, exist_ok=True)
 
-        # Move the file
-        shutil.move(str(source), str(destination))
+        # Same-volume moves are a single rename; only fall back to
+        # shutil.move's copy+delete when crossing devices
+        try:
+            os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(destination))
 
         return f"Moved '{source.name}' to '{destination}'"
 
@@ -3,7 +3,13 @@ GUI automation using pywinauto - SYSTEMATIC & ACCURATE
 Uses professional GUI automation core for ALL operations
 """
 
-import sys
+import functools
+import heapq
+import logging
+from dataclasses import dataclass
+import os
+import re
+import threading
 import time
 import json
 import subprocess
@@ -14,6 +20,141 @@ from pywinauto.findwindows import ElementNotFoundError
 # Import our professional GUI automation core
 from actions.gui_automation_core import WindowsGUIAutomation
 
+# Virtual-key codes for the media volume keys (winuser.h)
+VK_VOLUME_MUTE = 0xAD
+VK_VOLUME_DOWN = 0xAE
+VK_VOLUME_UP = 0xAF
+KEYEVENTF_KEYUP = 0x0002
+
+log = logging.getLogger("deskagent.gui")
+
+# Shared OpenAI client - created lazily and reused so the httpx connection
+# pool (TCP+TLS) stays warm across wizard steps instead of being rebuilt
+# on every navigation call
+_OPENAI_CLIENT = None
+_OPENAI_CLIENT_LOCK = threading.Lock()
+
+
+def _get_openai_client():
+    """Return the process-wide OpenAI client, creating it on first use"""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        with _OPENAI_CLIENT_LOCK:
+            if _OPENAI_CLIENT is None:
+                from openai import OpenAI
+                _OPENAI_CLIENT = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    return _OPENAI_CLIENT
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model_name() -> str:
+    """Model name from the environment, read once per process"""
+    return os.getenv('MODEL_NAME', 'gpt-4o-mini')
+
+# orjson's C parser is several times faster than stdlib json on the small
+# decision objects the model returns; optional, stdlib is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# First {...} blob in a model reply - one scan replaces the backtick /
+# "json" fence stripping that reprocessed the string several times
+_JSON_BLOB_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+@dataclass(frozen=True, slots=True)
+class Control:
+    """
+    One introspected UI control
+
+    Slots keep the per-control footprint a fraction of a dict's, which
+    matters when dense windows yield hundreds of these per snapshot.
+    """
+    name: str
+    type: str
+    clickable: bool
+    state: Optional[str] = None
+    value: Optional[Dict] = None
+
+    def to_dict(self) -> Dict:
+        """Dict form for prompts and logs, omitting unset fields"""
+        d = {"name": self.name, "type": self.type, "clickable": self.clickable}
+        if self.state is not None:
+            d["state"] = self.state
+        if self.value is not None:
+            d["value"] = self.value
+        return d
+
+
+# Prompt-size cap for ai_guided_navigation: rank controls by a cheap
+# relevance score and serialize only the best ones. Settings pages can
+# expose 200+ controls and prompt tokens dominate LLM latency; actionable
+# types outrank inert text when trimming
+_PROMPT_CONTROL_LIMIT = 25
+_CONTROL_TYPE_WEIGHTS = {"ToggleButton": 4, "Button": 3, "Hyperlink": 2, "Text": 1}
+
+
+def _score_control(ctrl: Control, goal_tokens: frozenset) -> int:
+    """Relevance of a control for the prompt: type weight + goal-keyword hits"""
+    name_lower = (ctrl.name or '').lower()
+    matches = sum(1 for token in goal_tokens if token in name_lower)
+    return _CONTROL_TYPE_WEIGHTS.get(ctrl.type, 0) + matches
+
+
+# System prompt for ai_guided_navigation, built once at import
+_AI_NAV_SYSTEM_PROMPT = (
+    "You are a Windows UI automation expert. "
+    "Analyze UI and decide the NEXT action in a multi-step process."
+)
+
+# Keyword sets and patterns for the hot dispatch paths - built once at
+# import, O(1) membership / single-scan matching instead of per-call lists
+_VOLUME_RE = re.compile(r"volume|sound|speaker|audio|mute")
+_SETTINGS_SUBPAGE_RE = re.compile(r"sound|audio|display|bluetooth")
+
+# Keywords marking a goal as Settings navigation (vs an install wizard);
+# compiled into one alternation so the per-step check is a single linear
+# scan instead of one substring search per keyword
+_SETTINGS_INDICATORS = (
+    'settings', 'firewall', 'bluetooth', 'wifi', 'network', 'defender',
+    'display', 'sound', 'privacy', 'update', 'storage', 'personalization',
+    'system', 'turn off', 'turn on', 'enable', 'disable', 'toggle'
+)
+_SETTINGS_INDICATORS_RE = re.compile('|'.join(map(re.escape, _SETTINGS_INDICATORS)))
+_GENERIC_SLIDER_NAMES = frozenset({"speed", "motion", "pointer", "rate", "slider", "volume", "brightness"})
+_MIN_WORDS = frozenset({"slow", "slowest", "min", "minimum", "mute", "zero", "0"})
+_MAX_WORDS = frozenset({"fast", "fastest", "max", "maximum", "unmute", "full", "100"})
+_MID_WORDS = frozenset({"medium", "middle", "mid", "50"})
+
+# UIA control-type IDs (UIAutomationClient.h) for the types the snapshot
+# path cares about - comparing raw integers skips pywinauto's per-element
+# ID-to-string translation; strings are only rebuilt for logging
+_CTRL_TYPE_IDS = {
+    "Button": 50000,
+    "CheckBox": 50002,
+    "Hyperlink": 50005,
+    "MenuItem": 50011,
+    "Slider": 50015,
+    "TabItem": 50019,
+    "Text": 50020,
+}
+
+# Full reverse map for translating cached ControlType IDs back to the
+# names the rest of the module (and the AI prompts) speak
+_CTRL_TYPE_NAMES = {
+    50000: "Button", 50001: "Calendar", 50002: "CheckBox", 50003: "ComboBox",
+    50004: "Edit", 50005: "Hyperlink", 50006: "Image", 50007: "ListItem",
+    50008: "List", 50009: "Menu", 50010: "MenuBar", 50011: "MenuItem",
+    50012: "ProgressBar", 50013: "RadioButton", 50014: "ScrollBar",
+    50015: "Slider", 50016: "Spinner", 50017: "StatusBar", 50018: "Tab",
+    50019: "TabItem", 50020: "Text", 50021: "ToolBar", 50022: "ToolTip",
+    50023: "Tree", 50024: "TreeItem", 50025: "Custom", 50026: "Group",
+    50027: "Thumb", 50028: "DataGrid", 50029: "DataItem", 50030: "Document",
+    50031: "SplitButton", 50032: "Window", 50033: "Pane", 50034: "Header",
+    50035: "HeaderItem", 50036: "Table", 50037: "TitleBar", 50038: "Separator",
+}
+
 
 class GUIActions:
     """
@@ -21,80 +162,310 @@ class GUIActions:
     Works accurately across ALL Windows operations
     """
 
+    # How long an introspection snapshot stays trustworthy; retries inside
+    # one wizard step land well within this window
+    UI_CACHE_TTL = 1.5
+
     def __init__(self):
         self.desktop = Desktop(backend="uia")
         # Initialize professional GUI core
         self.gui_core = WindowsGUIAutomation()
-        print(f"[GUI ACTIONS] Initialized with professional automation core", file=sys.stderr)
+        # Windows found by _find_window_fuzzy, keyed by their search terms -
+        # reusing the live wrapper avoids re-enumerating the desktop and
+        # gives later descendants() walks a stable root
+        self._window_cache = {}
+        # Introspection snapshots keyed by a cheap window fingerprint, so
+        # retries and wizard steps on an unchanged window skip the walk
+        self._ui_cache = {}
+        # LLM decisions keyed by (goal, UI signature) so retries over an
+        # unchanged window replay the answer instead of re-asking the model
+        self._decision_cache = {}
+        # The taskbar outlives the session; resolve it once and reuse
+        self._taskbar = None
+        # Low-level UIA handles so window-title matching can run inside the
+        # UIA COM server rather than client-side over every window
+        try:
+            from pywinauto.uia_defines import IUIA
+            self._iuia = IUIA().iuia
+            self._uia_root = self._iuia.GetRootElement()
+        except Exception:
+            self._iuia = None
+            self._uia_root = None
+        # Reusable CacheRequest for bulk Name/ControlType walks; pywinauto's
+        # cache_enable would rebuild an equivalent request on every call
+        self._name_type_cache_req = None
+        if self._iuia is not None:
+            try:
+                from pywinauto.uia_defines import IUIA
+                uia_defs = IUIA().UIA_dll
+                cache_req = self._iuia.CreateCacheRequest()
+                cache_req.AddProperty(uia_defs.UIA_NamePropertyId)
+                cache_req.AddProperty(uia_defs.UIA_ControlTypePropertyId)
+                self._name_type_cache_req = cache_req
+            except Exception:
+                pass
+        # Small worker pool for overlapping UIA introspection with waits
+        # elsewhere in a step (LLM round-trips, settle sleeps)
+        from concurrent.futures import ThreadPoolExecutor
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        log.info(f"[GUI ACTIONS] Initialized with professional automation core")
+
+    def _find_windows_by_terms(self, search_terms: List[str]) -> List[object]:
+        """
+        Match top-level windows against title terms in a single pass
+
+        Builds one OR of ignore-case substring Name conditions and lets the
+        UIA server evaluate it during a single FindAll, instead of pulling
+        every top-level window across the process boundary just to read its
+        title. Falls back to the client-side desktop.windows() scan when
+        the low-level handles are unavailable.
+        """
+        if self._uia_root is not None:
+            try:
+                from pywinauto.uia_defines import IUIA
+                from pywinauto.uia_element_info import UIAElementInfo
+                from pywinauto.controls.uiawrapper import UIAWrapper
+
+                uia_defs = IUIA().UIA_dll
+                flags = (uia_defs.PropertyConditionFlags_IgnoreCase |
+                         uia_defs.PropertyConditionFlags_MatchSubstring)
+                condition = self._iuia.CreatePropertyConditionEx(
+                    uia_defs.UIA_NamePropertyId, search_terms[0], flags)
+                for term in search_terms[1:]:
+                    condition = self._iuia.CreateOrCondition(
+                        condition,
+                        self._iuia.CreatePropertyConditionEx(
+                            uia_defs.UIA_NamePropertyId, term, flags))
+
+                found = self._uia_root.FindAll(uia_defs.TreeScope_Children, condition)
+                return [UIAWrapper(UIAElementInfo(found.GetElement(i)))
+                        for i in range(found.Length)]
+            except Exception as e:
+                log.warning(f"[GUI] Low-level window search failed, scanning client-side: {e}")
+
+        matches = []
+        for window in self.desktop.windows():
+            try:
+                title = window.window_text().lower()
+                if any(term.lower() in title for term in search_terms):
+                    matches.append(window)
+            except:
+                continue
+        return matches
 
     def _find_window_fuzzy(self, search_terms: List[str], timeout: int = 5) -> Optional[object]:
-        """Find window using fuzzy matching"""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            windows = self.desktop.windows()
-            for window in windows:
-                try:
-                    title = window.window_text().lower()
-                    if any(term.lower() in title for term in search_terms):
-                        return window
-                except:
-                    continue
-            time.sleep(0.5)
-        return None
+        """Find window using fuzzy matching (results cached per term set)"""
+        cache_key = tuple(sorted(term.lower() for term in search_terms))
+
+        # Serve from cache while the window is still alive
+        cached = self._window_cache.get(cache_key)
+        if cached is not None:
+            try:
+                cached.window_text()
+                return cached
+            except:
+                del self._window_cache[cache_key]
+
+        # Monotonic deadline (immune to wall-clock adjustments) and a short
+        # backed-off poll so a window is noticed soon after it opens
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        while True:
+            matches = self._find_windows_by_terms(search_terms)
+            if matches:
+                self._window_cache[cache_key] = matches[0]
+                return matches[0]
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(interval)
+            interval = min(interval * 1.4, 0.3)
+
+    def _wait_for_window(self, search_terms: List[str], timeout: float = 8) -> Optional[object]:
+        """
+        Poll for a window with exponential backoff instead of a fixed sleep
+
+        Checks start 50ms apart and back off (x1.5, capped at 400ms), so a
+        window that appears quickly is picked up in tens of milliseconds
+        while a slow one still gets the full timeout.
+        """
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        while True:
+            window = self._find_window_fuzzy(search_terms, timeout=0)
+            if window:
+                return window
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.4)
+
+    def _descendants_of_types(self, parent, control_types: List[str]) -> List[object]:
+        """
+        Fetch descendants of several control types in one FindAll
+
+        ORs ControlType PropertyConditions so the UIA server returns only
+        the matching elements in a single call, instead of one
+        descendants() pass per type. Falls back to the per-type walks when
+        raw COM access is unavailable.
+        """
+        if self._iuia is not None:
+            try:
+                from pywinauto.uia_defines import IUIA
+                from pywinauto.uia_element_info import UIAElementInfo
+                from pywinauto.controls.uiawrapper import UIAWrapper
+
+                uia_defs = IUIA().UIA_dll
+                type_ids = [_CTRL_TYPE_IDS[t] for t in control_types if t in _CTRL_TYPE_IDS]
+                if len(type_ids) == len(control_types):
+                    condition = self._iuia.CreatePropertyCondition(
+                        uia_defs.UIA_ControlTypePropertyId, type_ids[0])
+                    for type_id in type_ids[1:]:
+                        condition = self._iuia.CreateOrCondition(
+                            condition,
+                            self._iuia.CreatePropertyCondition(
+                                uia_defs.UIA_ControlTypePropertyId, type_id))
+
+                    found = parent.element_info.element.FindAll(
+                        uia_defs.TreeScope_Descendants, condition)
+                    return [UIAWrapper(UIAElementInfo(found.GetElement(i)))
+                            for i in range(found.Length)]
+            except Exception as e:
+                log.debug(f"[GUI] Batched type search failed, using per-type walks: {e}")
+
+        children = []
+        for ctype in control_types:
+            try:
+                children.extend(parent.descendants(control_type=ctype))
+            except Exception:
+                continue
+        return children
+
+    def _get_taskbar(self) -> Optional[object]:
+        """Return the taskbar window, cached for the life of the session"""
+        if self._taskbar is not None:
+            try:
+                self._taskbar.window_text()
+                return self._taskbar
+            except:
+                self._taskbar = None
+        self._taskbar = self._find_window_fuzzy(["taskbar", "notification"], timeout=3)
+        return self._taskbar
 
     def _find_control_fuzzy(self, parent, search_name: str, control_types: List[str] = None) -> Optional[object]:
         """Find control using fuzzy matching on multiple control types"""
         if control_types is None:
             control_types = ["Hyperlink", "Text", "Button", "MenuItem"]
 
-        print(f"[GUI] Searching for '{search_name}' in control types: {control_types}", file=sys.stderr)
+        log.debug(f"[GUI] Searching for '{search_name}' in control types: {control_types}")
 
-        # Manually enumerate descendants and search
+        # One batched, server-side-filtered fetch covers every wanted type
         search_lower = search_name.lower()
+        fuzzy_match = None
+        candidates = []
         try:
-            for child in parent.descendants():
+            for child in self._descendants_of_types(parent, control_types):
                 try:
                     text = child.window_text()
                     if not text:
                         continue
 
-                    ctype = child.element_info.control_type
-
-                    # Check if control type matches
-                    if ctype not in control_types:
-                        continue
-
                     # Check for exact or partial match
                     text_lower = text.lower()
                     if search_lower == text_lower:
-                        print(f"[GUI] Found exact match: '{text}' ({ctype})", file=sys.stderr)
-                        return child
-                    elif search_lower in text_lower:
-                        print(f"[GUI] Found fuzzy match: '{text}' ({ctype})", file=sys.stderr)
+                        log.debug(f"[GUI] Found exact match: '{text}'")
                         return child
+                    elif search_lower in text_lower and fuzzy_match is None:
+                        fuzzy_match = child
+                    else:
+                        candidates.append(text)
                 except:
                     continue
+            if fuzzy_match is not None:
+                log.debug(f"[GUI] Found fuzzy match: '{fuzzy_match.window_text()}'")
+                return fuzzy_match
         except Exception as e:
-            print(f"[GUI] Error during search: {e}", file=sys.stderr)
+            log.warning(f"[GUI] Error during search: {e}")
+            if fuzzy_match is not None:
+                return fuzzy_match
+
+        # Candidate names were collected during the single pass above; a
+        # miss usually just moves on to the next strategy, and re-walking
+        # the tree purely for logging would double the COM cost
+        log.warning(f"[GUI] Could not find '{search_name}'")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"[GUI] Available controls with matching types:")
+            for text in candidates:
+                log.debug(f"[GUI]   - '{text}'")
 
-        # List available controls for debugging (only relevant ones)
+        return None
+
+    def _snapshot_dialog(self, parent) -> Dict:
+        """
+        Take a one-pass snapshot of a dialog's controls
+
+        Returns a dict keyed by (control-type ID, lowercased name) so the
+        checkbox/slider/Apply/OK lookups that follow each other in
+        navigate_control_panel_settings share a single descendants() walk
+        instead of re-walking the tree per control. The raw integer ID is
+        read straight off the COM element, skipping pywinauto's
+        ID-to-string translation on every child.
+        """
+        snapshot = {}
         try:
-            print(f"[GUI] Could not find '{search_name}'. Available controls with matching types:", file=sys.stderr)
             for child in parent.descendants():
                 try:
-                    text = child.window_text()
-                    if not text:
-                        continue
-                    ctype = child.element_info.control_type
-                    if ctype in control_types:
-                        print(f"[GUI]   - '{text}' (type={ctype})", file=sys.stderr)
+                    key = (child.element_info.element.CurrentControlType,
+                           child.window_text().lower())
+                    snapshot.setdefault(key, child)
                 except:
-                    pass
-        except:
-            pass
+                    continue
+        except Exception as e:
+            log.warning(f"[GUI] Error snapshotting dialog: {e}")
+        return snapshot
 
+    @staticmethod
+    def _snapshot_find(snapshot: Dict, search_name: str, control_types: List[str]) -> Optional[object]:
+        """Exact-then-substring lookup against a _snapshot_dialog result"""
+        search_lower = search_name.lower()
+        type_ids = [_CTRL_TYPE_IDS[t] for t in control_types if t in _CTRL_TYPE_IDS]
+        for type_id in type_ids:
+            child = snapshot.get((type_id, search_lower))
+            if child is not None:
+                return child
+        for (type_id, text), child in snapshot.items():
+            if type_id in type_ids and search_lower in text:
+                return child
         return None
 
+    def _commit_dialog(self, parent, snapshot: Dict) -> None:
+        """
+        Commit a dialog's pending changes
+
+        Property-sheet dialogs honour ENTER as their default (OK) button,
+        which applies and closes in one keystroke - no Apply lookup and no
+        fixed pause between two clicks. If ENTER cannot be sent, or the
+        window has no OK button at all, fall back to clicking the buttons
+        resolved from the shared snapshot.
+        """
+        ok_btn = self._snapshot_find(snapshot, "OK", ["Button"])
+        if ok_btn is not None:
+            try:
+                parent.type_keys("{ENTER}")
+                return
+            except Exception as e:
+                log.warning(f"[GUI] ENTER commit failed, clicking buttons: {e}")
+
+            apply_btn = self._snapshot_find(snapshot, "Apply", ["Button"])
+            if apply_btn:
+                apply_btn.click_input()
+                time.sleep(0.3)
+            ok_btn.click_input()
+            return
+
+        apply_btn = self._snapshot_find(snapshot, "Apply", ["Button"])
+        if apply_btn:
+            apply_btn.click_input()
+
     def navigate_control_panel_settings(self, ui_path: List[str], action: Dict) -> str:
         """
         Navigate through Control Panel or Settings UI with dynamic multi-strategy approach
@@ -107,71 +478,72 @@ class GUIActions:
             Success message
         """
         try:
-            print(f"[GUI] Navigating path: {ui_path}", file=sys.stderr)
-            print(f"[GUI] Action: {action}", file=sys.stderr)
+            log.info(f"[GUI] Navigating path: {ui_path}")
+            log.debug(f"[GUI] Action: {action}")
 
             # DYNAMIC APPROACH: Detect if this is a volume/speaker control request
             # Try multiple strategies in order of reliability
-            is_volume_control = any(
-                keyword in str(ui_path).lower() or keyword in str(action).lower()
-                for keyword in ["volume", "sound", "speaker", "audio", "mute"]
-            )
+            request_blob = (" ".join(ui_path) + " " + str(action)).lower()
+            is_volume_control = _VOLUME_RE.search(request_blob) is not None
 
             if is_volume_control:
-                print(f"[GUI] Detected volume control request - using multi-strategy approach", file=sys.stderr)
+                log.debug(f"[GUI] Detected volume control request - using multi-strategy approach")
                 return self._handle_volume_control_dynamic(action)
 
             # Step 1: Determine what to open based on ui_path[0]
             target_window = None
 
             if "Control Panel" in ui_path[0] or "control" in ui_path[0].lower():
-                # Open Control Panel
-                import subprocess
-                subprocess.Popen("control", shell=True)
-                print(f"[GUI] Waiting for Control Panel to open...", file=sys.stderr)
-                time.sleep(3)
-                target_window = self._find_window_fuzzy(["control panel", "settings", "all control panel items"])
+                # Reuse an already-open Control Panel before spawning a new one
+                target_window = self._find_window_fuzzy(
+                    ["control panel", "all control panel items"], timeout=0.2)
+                if not target_window:
+                    # Open Control Panel directly - no cmd.exe in between
+                    import subprocess
+                    subprocess.Popen(["control.exe"])
+                    log.debug(f"[GUI] Waiting for Control Panel to open...")
+                    target_window = self._wait_for_window(["control panel", "settings", "all control panel items"])
 
             elif "Settings" in ui_path[0] or "settings" in ui_path[0].lower():
                 # Open Windows Settings - try multiple possible URIs dynamically
-                import subprocess
-
                 # Try to open specific settings page if we can infer it
                 settings_uri = "ms-settings:"
                 if len(ui_path) > 1:
-                    category = ui_path[1].lower()
-                    if "sound" in category or "audio" in category:
-                        settings_uri = "ms-settings:sound"
-                    elif "display" in category:
-                        settings_uri = "ms-settings:display"
-                    elif "bluetooth" in category:
-                        settings_uri = "ms-settings:bluetooth"
-
-                subprocess.Popen(f"start {settings_uri}", shell=True)
-                print(f"[GUI] Opening Settings with URI: {settings_uri}", file=sys.stderr)
-                time.sleep(2)
+                    subpage = _SETTINGS_SUBPAGE_RE.search(ui_path[1].lower())
+                    if subpage:
+                        page = subpage.group(0)
+                        settings_uri = "ms-settings:" + ("sound" if page == "audio" else page)
+
+                # Reuse an open Settings window when no specific page is
+                # needed; otherwise launch the URI (cheap if already running)
+                if settings_uri == "ms-settings:":
+                    target_window = self._find_window_fuzzy(["settings"], timeout=0.2)
+                if not target_window:
+                    # os.startfile hits ShellExecuteW in-process instead of
+                    # spawning cmd.exe to run its "start" built-in
+                    os.startfile(settings_uri)
+                    log.debug(f"[GUI] Opening Settings with URI: {settings_uri}")
 
-                # Try multiple possible window titles dynamically
-                target_window = self._find_window_fuzzy(["settings", "system settings", "windows settings", "sound", "system"])
+                    # Try multiple possible window titles dynamically
+                    target_window = self._wait_for_window(["settings", "system settings", "windows settings", "sound", "system"])
 
             else:
                 # For anything else (like "Speakers", "Network", etc.), try to find as system tray icon
-                print(f"[GUI] Looking for '{ui_path[0]}' (could be system tray icon or window)...", file=sys.stderr)
+                log.debug(f"[GUI] Looking for '{ui_path[0]}' (could be system tray icon or window)...")
 
                 # First, try to find it as a system tray icon and click it
                 # System tray is part of the taskbar
-                taskbar = self._find_window_fuzzy(["taskbar"])
+                taskbar = self._get_taskbar()
                 if taskbar:
-                    print(f"[GUI] Found taskbar, searching for '{ui_path[0]}' icon...", file=sys.stderr)
+                    log.debug(f"[GUI] Found taskbar, searching for '{ui_path[0]}' icon...")
                     icon = self._find_control_fuzzy(taskbar, ui_path[0], ["Button"])
                     if icon:
-                        print(f"[GUI] Found and clicking system tray icon: {ui_path[0]}", file=sys.stderr)
+                        log.debug(f"[GUI] Found and clicking system tray icon: {ui_path[0]}")
                         icon.click_input()
-                        time.sleep(1)
                         # Now find the popup window that opened
-                        target_window = self._find_window_fuzzy([ui_path[0], "volume", "slider"])
+                        target_window = self._wait_for_window([ui_path[0], "volume", "slider"], timeout=3)
                     else:
-                        print(f"[GUI] '{ui_path[0]}' not found in system tray, trying as window name...", file=sys.stderr)
+                        log.debug(f"[GUI] '{ui_path[0]}' not found in system tray, trying as window name...")
 
                 # If not found as system tray icon, try finding as a window
                 if not target_window:
@@ -180,14 +552,14 @@ class GUIActions:
             if not target_window:
                 raise Exception(f"Could not find target window/icon: {ui_path[0]}")
 
-            print(f"[GUI] Found window: {target_window.window_text()}", file=sys.stderr)
+            log.info(f"[GUI] Found window: {target_window.window_text()}")
 
             # Step 3: Navigate to target (e.g., "Mouse", "File Explorer Options")
             # If ui_path has only 1 element, we're already at the target (e.g., system tray icon clicked)
             dialog = None
             if len(ui_path) > 1:
                 target_name = ui_path[1]
-                print(f"[GUI] Looking for: {target_name}", file=sys.stderr)
+                log.debug(f"[GUI] Looking for: {target_name}")
 
                 # Find and click the target using fuzzy matching
                 target_control = self._find_control_fuzzy(target_window, target_name)
@@ -195,12 +567,11 @@ class GUIActions:
                 if not target_control:
                     raise Exception(f"Could not find '{target_name}' in Control Panel. Check debug logs for available controls.")
 
-                print(f"[GUI] Clicking on: {target_control.window_text()}", file=sys.stderr)
+                log.info(f"[GUI] Clicking on: {target_control.window_text()}")
                 target_control.click_input()
-                time.sleep(2)
 
                 # Find the dialog/properties window that opened
-                dialog = self._find_window_fuzzy(["properties", "options", ui_path[1]], timeout=3)
+                dialog = self._wait_for_window(["properties", "options", ui_path[1]], timeout=5)
 
             # If ui_path has only 1 element, the target_window itself is what we work with
             if not dialog and len(ui_path) == 1:
@@ -209,22 +580,22 @@ class GUIActions:
             # Step 4: Handle tabs if specified (e.g., "Pointer Options" tab, "View" tab)
             if len(ui_path) > 2:
                 tab_name = ui_path[2]
-                print(f"[GUI] Switching to tab: {tab_name}", file=sys.stderr)
+                log.debug(f"[GUI] Switching to tab: {tab_name}")
 
                 if dialog:
-                    print(f"[GUI] Found dialog: {dialog.window_text()}", file=sys.stderr)
+                    log.debug(f"[GUI] Found dialog: {dialog.window_text()}")
 
                     # Try to find the tab
                     tab_control = self._find_control_fuzzy(dialog, tab_name, ["TabItem"])
 
                     if tab_control:
-                        print(f"[GUI] Switching to tab: {tab_control.window_text()}", file=sys.stderr)
+                        log.debug(f"[GUI] Switching to tab: {tab_control.window_text()}")
                         tab_control.click_input()
                         time.sleep(0.5)
                     else:
-                        print(f"[GUI] Warning: Could not find tab '{tab_name}'", file=sys.stderr)
+                        log.warning(f"[GUI] Warning: Could not find tab '{tab_name}'")
                 else:
-                    print(f"[GUI] Warning: Could not find properties/options dialog", file=sys.stderr)
+                    log.warning(f"[GUI] Warning: Could not find properties/options dialog")
 
             # Step 5: Perform the action
             action_type = action.get("type")
@@ -233,11 +604,13 @@ class GUIActions:
                 checkbox_name = action.get("name")
                 checkbox_value = action.get("value", True)
 
-                print(f"[GUI] Setting checkbox '{checkbox_name}' to {checkbox_value}", file=sys.stderr)
+                log.debug(f"[GUI] Setting checkbox '{checkbox_name}' to {checkbox_value}")
 
-                # Find checkbox using fuzzy matching
+                # Snapshot the dialog once; checkbox and Apply/OK lookups
+                # all resolve against the same walk
                 parent = dialog if dialog else target_window
-                checkbox = self._find_control_fuzzy(parent, checkbox_name, ["CheckBox"])
+                snapshot = self._snapshot_dialog(parent)
+                checkbox = self._snapshot_find(snapshot, checkbox_name, ["CheckBox"])
 
                 if not checkbox:
                     raise Exception(f"Could not find checkbox '{checkbox_name}'")
@@ -247,19 +620,12 @@ class GUIActions:
 
                 if current_state != target_state:
                     checkbox.click_input()
-                    print(f"[GUI] Checkbox toggled", file=sys.stderr)
+                    log.debug(f"[GUI] Checkbox toggled")
                 else:
-                    print(f"[GUI] Checkbox already in desired state", file=sys.stderr)
-
-                # Click Apply/OK button
-                apply_btn = self._find_control_fuzzy(parent, "Apply", ["Button"])
-                if apply_btn:
-                    apply_btn.click_input()
-                    time.sleep(0.3)
+                    log.debug(f"[GUI] Checkbox already in desired state")
 
-                ok_btn = self._find_control_fuzzy(parent, "OK", ["Button"])
-                if ok_btn:
-                    ok_btn.click_input()
+                # Commit via the dialog's default button
+                self._commit_dialog(parent, snapshot)
 
                 return f"Successfully set '{checkbox_name}' to {checkbox_value}"
 
@@ -267,195 +633,238 @@ class GUIActions:
                 slider_name = action.get("name", "")
                 slider_value = action.get("value", "")
 
-                print(f"[GUI] Adjusting slider '{slider_name}' to '{slider_value}'", file=sys.stderr)
+                log.debug(f"[GUI] Adjusting slider '{slider_name}' to '{slider_value}'")
 
                 # Find slider - for generic names like "speed" or "motion", just use the first slider
-                generic_slider_names = ["speed", "motion", "pointer", "rate", "slider", "volume", "brightness"]
-
                 parent = dialog if dialog else target_window
-
-                if slider_name.lower() in generic_slider_names:
-                    print(f"[GUI] Generic slider name detected, finding first available slider", file=sys.stderr)
-                    slider = None
-                    try:
-                        for child in parent.descendants():
-                            try:
-                                if child.element_info.control_type == "Slider":
-                                    slider = child
-                                    print(f"[GUI] Using slider: '{child.window_text()}'", file=sys.stderr)
-                                    break
-                            except:
-                                continue
-                    except:
-                        pass
+                snapshot = self._snapshot_dialog(parent)
+
+                if slider_name.lower() in _GENERIC_SLIDER_NAMES:
+                    log.debug(f"[GUI] Generic slider name detected, finding first available slider")
+                    slider = next(
+                        (child for (type_id, _), child in snapshot.items()
+                         if type_id == _CTRL_TYPE_IDS["Slider"]),
+                        None
+                    )
+                    if slider:
+                        log.debug(f"[GUI] Using slider: '{slider.window_text()}'")
                 else:
-                    # Find slider using fuzzy matching
-                    slider = self._find_control_fuzzy(parent, slider_name, ["Slider"])
+                    slider = self._snapshot_find(snapshot, slider_name, ["Slider"])
 
                 if not slider:
-                    print(f"[GUI] Could not find slider '{slider_name}'", file=sys.stderr)
+                    log.warning(f"[GUI] Could not find slider '{slider_name}'")
                     raise Exception(f"Could not find slider '{slider_name}'")
 
                 # Adjust slider based on value
-                if slider_value.lower() in ["slow", "slowest", "min", "minimum"]:
+                if slider_value.lower() in _MIN_WORDS:
                     # Set to minimum
                     slider.set_value(slider.min_value())
-                    print(f"[GUI] Set slider to minimum", file=sys.stderr)
-                elif slider_value.lower() in ["fast", "fastest", "max", "maximum"]:
+                    log.debug(f"[GUI] Set slider to minimum")
+                elif slider_value.lower() in _MAX_WORDS:
                     # Set to maximum
                     slider.set_value(slider.max_value())
-                    print(f"[GUI] Set slider to maximum", file=sys.stderr)
-                elif slider_value.lower() in ["medium", "middle", "mid"]:
+                    log.debug(f"[GUI] Set slider to maximum")
+                elif slider_value.lower() in _MID_WORDS:
                     # Set to middle
                     mid = (slider.min_value() + slider.max_value()) // 2
                     slider.set_value(mid)
-                    print(f"[GUI] Set slider to middle", file=sys.stderr)
+                    log.debug(f"[GUI] Set slider to middle")
 
-                # Click Apply/OK button (reuse parent variable defined earlier)
-                apply_btn = self._find_control_fuzzy(parent, "Apply", ["Button"])
-                if apply_btn:
-                    apply_btn.click_input()
-                    time.sleep(0.3)
-
-                ok_btn = self._find_control_fuzzy(parent, "OK", ["Button"])
-                if ok_btn:
-                    ok_btn.click_input()
+                # Commit via the dialog's default button (reuse snapshot)
+                self._commit_dialog(parent, snapshot)
 
                 return f"Successfully adjusted '{slider_name}' to '{slider_value}'"
 
             return "Navigation completed"
 
         except Exception as e:
-            print(f"[GUI] Error: {e}", file=sys.stderr)
+            log.warning(f"[GUI] Error: {e}")
             raise Exception(f"GUI automation failed: {str(e)}")
 
     def _handle_volume_control_dynamic(self, action: Dict) -> str:
         """
         Dynamic multi-strategy volume control
-        Tries multiple approaches to control volume without hardcoded paths
+
+        Strategies are ordered by cost: targets expressible as media keys
+        go straight to keybd_event without touching UIA; otherwise the UIA
+        strategies race on a thread pool and the first success wins, so
+        total latency is the fastest strategy rather than the sum of every
+        failed strategy's timeout. The Settings app stays a serial last
+        resort because it spawns a whole UI.
         """
-        import subprocess
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         action_value = action.get("value", "").lower()
 
-        print(f"[GUI] === DYNAMIC VOLUME CONTROL ===", file=sys.stderr)
-        print(f"[GUI] Target: {action_value}", file=sys.stderr)
+        log.info(f"[GUI] === DYNAMIC VOLUME CONTROL ===")
+        log.debug(f"[GUI] Target: {action_value}")
+
+        # Cheapest path first: mute/min/max/mid map directly onto media-key
+        # presses, which land in milliseconds without probing the taskbar
+        result = self._run_volume_strategy(self._volume_strategy_send_keys, action_value)
+        if result:
+            return result
+
+        strategies = [
+            self._volume_strategy_tray_icon,
+            self._volume_strategy_quick_settings,
+        ]
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            futures = [
+                executor.submit(self._run_volume_strategy, strategy, action_value)
+                for strategy in strategies
+            ]
+            try:
+                for future in as_completed(futures, timeout=15):
+                    result = future.result()
+                    if result:
+                        for other in futures:
+                            other.cancel()
+                        return result
+            except Exception as e:
+                log.warning(f"[GUI] Strategy race did not complete: {e}")
 
-        # Strategy 1: Try system tray volume icon (most reliable)
-        print(f"[GUI] Strategy 1: System tray volume icon", file=sys.stderr)
+        # Strategy 4: Settings app as last resort
+        log.info(f"[GUI] Strategy 4: Windows Settings app")
         try:
-            # Find taskbar
-            taskbar = self._find_window_fuzzy(["taskbar", "notification"], timeout=3)
-            if taskbar:
-                # Try to find volume/speaker icon - Windows uses different names
-                for icon_name in ["speakers", "volume", "sound", "audio", "notification chevron"]:
-                    icon = self._find_control_fuzzy(taskbar, icon_name, ["Button"])
-                    if icon:
-                        print(f"[GUI] Found system tray icon: {icon_name}", file=sys.stderr)
-                        icon.click_input()
-                        time.sleep(1.5)
-
-                        # Look for volume slider popup - try to find ANY slider
-                        volume_window = self._find_window_fuzzy(["volume", "slider", "sound"], timeout=2)
-                        if volume_window:
-                            print(f"[GUI] Found volume popup window", file=sys.stderr)
-                            return self._adjust_first_slider(volume_window, action_value)
-                        break
-        except Exception as e:
-            print(f"[GUI] Strategy 1 failed: {e}", file=sys.stderr)
+            os.startfile("ms-settings:sound")
 
-        # Strategy 2: Try Quick Settings (Windows 11)
-        print(f"[GUI] Strategy 2: Quick Settings panel", file=sys.stderr)
-        try:
-            # Windows 11 quick settings
-            quick_settings = self._find_window_fuzzy(["quick settings", "notification center"], timeout=2)
-            if quick_settings:
-                print(f"[GUI] Found Quick Settings", file=sys.stderr)
-                return self._adjust_first_slider(quick_settings, action_value)
+            settings_window = self._wait_for_window(["settings", "sound", "system"], timeout=6)
+            if settings_window:
+                log.info(f"[GUI] Found Settings window: {settings_window.window_text()}")
+                return self._adjust_first_slider(settings_window, action_value)
         except Exception as e:
-            print(f"[GUI] Strategy 2 failed: {e}", file=sys.stderr)
+            log.warning(f"[GUI] Strategy 4 failed: {e}")
+
+        raise Exception("All volume control strategies failed. Please check if volume controls are accessible.")
 
-        # Strategy 3: PowerShell command (most reliable fallback)
-        print(f"[GUI] Strategy 3: PowerShell command", file=sys.stderr)
+    def _run_volume_strategy(self, strategy, action_value: str) -> Optional[str]:
+        """Run one volume strategy on a worker thread with its own COM init"""
+        com = None
+        try:
+            import comtypes
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+            com = comtypes
+        except Exception:
+            pass
         try:
-            if action_value in ["min", "minimum", "mute", "zero", "0"]:
-                # Mute
-                cmd = 'powershell -Command "(New-Object -ComObject WScript.Shell).SendKeys([char]173)"'
-                subprocess.run(cmd, shell=True, check=True)
-                return "Volume muted using PowerShell"
-            elif action_value in ["max", "maximum", "unmute", "full", "100"]:
-                # Set to max - first unmute, then set high
-                subprocess.run('powershell -Command "$obj = New-Object -ComObject WScript.Shell; 1..50 | ForEach-Object { $obj.SendKeys([char]175) }"', shell=True, check=True, timeout=5)
-                return "Volume set to maximum using PowerShell"
-            elif action_value in ["medium", "middle", "mid", "50"]:
-                # Medium volume
-                subprocess.run('powershell -Command "$obj = New-Object -ComObject WScript.Shell; 1..25 | ForEach-Object { $obj.SendKeys([char]175) }"', shell=True, check=True, timeout=5)
-                return "Volume set to medium using PowerShell"
+            return strategy(action_value)
         except Exception as e:
-            print(f"[GUI] Strategy 3 failed: {e}", file=sys.stderr)
+            log.warning(f"[GUI] {strategy.__name__} failed: {e}")
+            return None
+        finally:
+            if com is not None:
+                try:
+                    com.CoUninitialize()
+                except Exception:
+                    pass
 
-        # Strategy 4: Settings app as last resort
-        print(f"[GUI] Strategy 4: Windows Settings app", file=sys.stderr)
-        try:
-            subprocess.Popen("start ms-settings:sound", shell=True)
-            time.sleep(3)
+    def _volume_strategy_tray_icon(self, action_value: str) -> Optional[str]:
+        """Strategy 1: click the system tray volume icon and use its slider"""
+        log.info(f"[GUI] Strategy 1: System tray volume icon")
+        taskbar = self._get_taskbar()
+        if not taskbar:
+            return None
+
+        # Try to find volume/speaker icon - Windows uses different names
+        for icon_name in ["speakers", "volume", "sound", "audio", "notification chevron"]:
+            icon = self._find_control_fuzzy(taskbar, icon_name, ["Button"])
+            if icon:
+                log.debug(f"[GUI] Found system tray icon: {icon_name}")
+                icon.click_input()
+
+                # Look for volume slider popup - try to find ANY slider
+                volume_window = self._wait_for_window(["volume", "slider", "sound"], timeout=3.5)
+                if volume_window:
+                    log.debug(f"[GUI] Found volume popup window")
+                    return self._adjust_first_slider(volume_window, action_value)
+                break
+        return None
 
-            settings_window = self._find_window_fuzzy(["settings", "sound", "system"], timeout=3)
-            if settings_window:
-                print(f"[GUI] Found Settings window: {settings_window.window_text()}", file=sys.stderr)
-                return self._adjust_first_slider(settings_window, action_value)
+    def _volume_strategy_quick_settings(self, action_value: str) -> Optional[str]:
+        """Strategy 2: the Windows 11 Quick Settings panel"""
+        log.info(f"[GUI] Strategy 2: Quick Settings panel")
+        quick_settings = self._find_window_fuzzy(["quick settings", "notification center"], timeout=2)
+        if quick_settings:
+            log.debug(f"[GUI] Found Quick Settings")
+            return self._adjust_first_slider(quick_settings, action_value)
+        return None
+
+    def _volume_strategy_send_keys(self, action_value: str) -> Optional[str]:
+        """Strategy 3: synthesized volume key presses"""
+        log.info(f"[GUI] Strategy 3: Volume key events")
+
+        if action_value in _MIN_WORDS:
+            key, presses, outcome = VK_VOLUME_MUTE, 1, "Volume muted"
+        elif action_value in _MAX_WORDS:
+            key, presses, outcome = VK_VOLUME_UP, 50, "Volume set to maximum"
+        elif action_value in _MID_WORDS:
+            key, presses, outcome = VK_VOLUME_UP, 25, "Volume set to medium"
+        else:
+            return None
+
+        # Inject the key events in-process: a 50-stroke keybd_event burst
+        # takes milliseconds versus hundreds of ms of PowerShell startup
+        try:
+            import ctypes
+            user32 = ctypes.windll.user32
+            for _ in range(presses):
+                user32.keybd_event(key, 0, 0, 0)
+                user32.keybd_event(key, 0, KEYEVENTF_KEYUP, 0)
+            return f"{outcome} using volume key events"
         except Exception as e:
-            print(f"[GUI] Strategy 4 failed: {e}", file=sys.stderr)
+            log.warning(f"[GUI] keybd_event unavailable, falling back to PowerShell: {e}")
 
-        raise Exception("All volume control strategies failed. Please check if volume controls are accessible.")
+        # PowerShell SendKeys fallback (pays process + CLR startup)
+        import subprocess
+        char = 173 if key == VK_VOLUME_MUTE else 175
+        script = f"$obj = New-Object -ComObject WScript.Shell; 1..{presses} | ForEach-Object {{ $obj.SendKeys([char]{char}) }}"
+        subprocess.run(f'powershell -Command "{script}"', shell=True, check=True, timeout=5)
+        return f"{outcome} using PowerShell"
 
     def _adjust_first_slider(self, parent_window, target_value: str) -> str:
         """
         Find and adjust the first available slider in a window
         Works with any slider without needing to know its name
         """
-        print(f"[GUI] Searching for sliders in window: {parent_window.window_text()}", file=sys.stderr)
+        log.debug(f"[GUI] Searching for sliders in window: {parent_window.window_text()}")
 
         slider = None
         try:
-            # Find first slider dynamically
-            for child in parent_window.descendants():
-                try:
-                    if child.element_info.control_type == "Slider":
-                        slider = child
-                        print(f"[GUI] Found slider: '{child.window_text()}'", file=sys.stderr)
-                        break
-                except:
-                    continue
+            # Find first slider dynamically (type filter applied by UIA itself)
+            for child in parent_window.descendants(control_type="Slider"):
+                slider = child
+                log.debug(f"[GUI] Found slider: '{child.window_text()}'")
+                break
         except Exception as e:
-            print(f"[GUI] Error searching for slider: {e}", file=sys.stderr)
+            log.warning(f"[GUI] Error searching for slider: {e}")
 
         if not slider:
-            # List all controls for debugging
-            print(f"[GUI] Available controls:", file=sys.stderr)
-            try:
-                for child in parent_window.descendants():
-                    try:
-                        ctype = child.element_info.control_type
-                        text = child.window_text()
-                        print(f"[GUI]   - {ctype}: '{text}'", file=sys.stderr)
-                    except:
-                        pass
-            except:
-                pass
+            # List all controls for debugging - this walks the full tree,
+            # so only do it when explicitly asked for
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"[GUI] Available controls:")
+                try:
+                    for info in parent_window.element_info.descendants(cache_enable=True):
+                        try:
+                            log.debug(f"[GUI]   - {info.control_type}: '{info.name}'")
+                        except:
+                            pass
+                except:
+                    pass
             raise Exception("No slider found in window")
 
         # Adjust slider based on target value
-        if target_value in ["slow", "slowest", "min", "minimum", "mute", "zero", "0"]:
+        if target_value in _MIN_WORDS:
             slider.set_value(slider.min_value())
-            print(f"[GUI] Set slider to minimum: {slider.min_value()}", file=sys.stderr)
-        elif target_value in ["fast", "fastest", "max", "maximum", "unmute", "full", "100"]:
+            log.debug(f"[GUI] Set slider to minimum: {slider.min_value()}")
+        elif target_value in _MAX_WORDS:
             slider.set_value(slider.max_value())
-            print(f"[GUI] Set slider to maximum: {slider.max_value()}", file=sys.stderr)
-        elif target_value in ["medium", "middle", "mid", "50"]:
+            log.debug(f"[GUI] Set slider to maximum: {slider.max_value()}")
+        elif target_value in _MID_WORDS:
             mid = (slider.min_value() + slider.max_value()) // 2
             slider.set_value(mid)
-            print(f"[GUI] Set slider to middle: {mid}", file=sys.stderr)
+            log.debug(f"[GUI] Set slider to middle: {mid}")
 
         return f"Successfully adjusted volume to '{target_value}'"
 
@@ -472,17 +881,9 @@ class GUIActions:
             Success message
         """
         try:
-            # Find the window
-            windows = self.desktop.windows()
-            target_window = None
-
-            for window in windows:
-                try:
-                    if window_title.lower() in window.window_text().lower():
-                        target_window = window
-                        break
-                except:
-                    continue
+            # Find the window (title matched server-side)
+            matches = self._find_windows_by_terms([window_title])
+            target_window = matches[0] if matches else None
 
             if not target_window:
                 raise Exception(f"Could not find window with title '{window_title}'")
@@ -500,7 +901,46 @@ class GUIActions:
     # PRIMITIVE OPERATIONS - AI-DRIVEN ARCHITECTURE
     # ============================================================================
 
-    def introspect_ui(self, window_search_terms: List[str], open_command: str = None) -> Dict:
+    def _walk_name_type(self, window):
+        """
+        Yield (element_info, control_type, name) for every descendant
+
+        One FindAllBuildCache with the CacheRequest built at init returns
+        the elements with Name and ControlType already attached, so the
+        tight loop reads GetCachedPropertyValue locally instead of paying
+        a COM round-trip per property. The elements keep live references
+        (full AutomationElementMode) because toggle and slider state still
+        has to be read through their patterns. Falls back to pywinauto's
+        per-call cached walk if the raw handles are unavailable.
+        """
+        if self._name_type_cache_req is not None:
+            try:
+                from pywinauto.uia_defines import IUIA
+                from pywinauto.uia_element_info import UIAElementInfo
+
+                uia_defs = IUIA().UIA_dll
+                found = window.element_info.element.FindAllBuildCache(
+                    uia_defs.TreeScope_Descendants,
+                    self._iuia.CreateTrueCondition(),
+                    self._name_type_cache_req)
+
+                results = []
+                for i in range(found.Length):
+                    element = found.GetElement(i)
+                    type_id = element.GetCachedPropertyValue(uia_defs.UIA_ControlTypePropertyId)
+                    name = element.GetCachedPropertyValue(uia_defs.UIA_NamePropertyId)
+                    results.append((UIAElementInfo(element),
+                                    _CTRL_TYPE_NAMES.get(type_id, str(type_id)),
+                                    name))
+                return results
+            except Exception as e:
+                log.debug(f"[GUI] Cached bulk walk failed, using per-call cache: {e}")
+
+        return [(info, info.control_type, info.name)
+                for info in window.element_info.descendants(cache_enable=True)]
+
+    def introspect_ui(self, window_search_terms: List[str], open_command: str = None,
+                      limit: Optional[int] = 200) -> Dict:
         """
         PRIMITIVE OPERATION: Inspect UI and return complete structure for AI analysis.
 
@@ -510,13 +950,16 @@ class GUIActions:
         Args:
             window_search_terms: Terms to find the window (e.g., ["Settings", "Bluetooth"])
             open_command: Optional command to open the window first (e.g., "ms-settings:bluetooth")
+            limit: Stop after this many controls; pathological windows can
+                hold tens of thousands of descendants the AI never reads.
+                Pass None to enumerate everything.
 
         Returns:
             {
                 "window": "Window title",
                 "controls": [
-                    {"name": "Bluetooth", "type": "ToggleButton", "state": "Off", "clickable": True},
-                    {"name": "Add device", "type": "Button", "clickable": True},
+                    Control(name="Bluetooth", type="ToggleButton", state="Off", clickable=True),
+                    Control(name="Add device", type="Button", clickable=True),
                     ...
                 ],
                 "strategy": "Description of what was done"
@@ -524,7 +967,7 @@ class GUIActions:
         """
         import subprocess
 
-        print(f"[GUI INTROSPECT] Analyzing UI for: {window_search_terms}", file=sys.stderr)
+        log.info(f"[GUI INTROSPECT] Analyzing UI for: {window_search_terms}")
 
         # Open window if command provided (using professional core)
         if open_command:
@@ -532,7 +975,7 @@ class GUIActions:
             if "ms-settings" in open_command:
                 target_window = self.gui_core.open_settings_page(open_command)
             else:
-                print(f"[GUI INTROSPECT] Opening: {open_command}", file=sys.stderr)
+                log.debug(f"[GUI INTROSPECT] Opening: {open_command}")
                 subprocess.Popen(open_command, shell=True)
                 time.sleep(2)
                 target_window = self.gui_core.find_window(window_search_terms, timeout=5)
@@ -549,21 +992,35 @@ class GUIActions:
             }
 
         window_title = target_window.window_text()
-        print(f"[GUI INTROSPECT] Found window: {window_title}", file=sys.stderr)
+        log.info(f"[GUI INTROSPECT] Found window: {window_title}")
 
-        # Enumerate ALL controls
+        # Speculative cache: the same title with the same top-level child
+        # count within the TTL means the tree almost certainly has not
+        # changed, so the expensive descendant walk can be skipped
+        try:
+            fingerprint = (window_title, len(target_window.children()))
+        except Exception:
+            fingerprint = None
+        if fingerprint is not None:
+            cached = self._ui_cache.get(fingerprint)
+            if cached is not None and time.monotonic() - cached[0] < self.UI_CACHE_TTL:
+                log.debug(f"[GUI INTROSPECT] Serving cached introspection for '{window_title}'")
+                return cached[1]
+
+        # Enumerate controls - the bulk walk delivers Name/ControlType
+        # prefetched per element; only toggles and sliders get wrapped so
+        # their live pattern state can be read
         controls = []
         try:
-            for child in target_window.descendants():
-                try:
-                    control_type = child.element_info.control_type
-                    name = child.window_text()
+            from pywinauto.controls.uiawrapper import UIAWrapper
 
+            for info, control_type, name in self._walk_name_type(target_window):
+                try:
                     # Get state for toggles/checkboxes
                     state = None
                     try:
                         if control_type in ["ToggleButton", "CheckBox"]:
-                            toggle_state = child.get_toggle_state()
+                            toggle_state = UIAWrapper(info).get_toggle_state()
                             state = "On" if toggle_state == 1 else "Off"
                     except:
                         pass
@@ -572,10 +1029,11 @@ class GUIActions:
                     value = None
                     try:
                         if control_type == "Slider":
+                            slider = UIAWrapper(info)
                             value = {
-                                "current": child.value(),
-                                "min": child.min_value(),
-                                "max": child.max_value()
+                                "current": slider.value(),
+                                "min": slider.min_value(),
+                                "max": slider.max_value()
                             }
                     except:
                         pass
@@ -593,40 +1051,45 @@ class GUIActions:
                         else:
                             display_name = name  # Keep empty for other types
 
-                    control_info = {
-                        "name": display_name,
-                        "type": control_type,
-                        "clickable": clickable
-                    }
-
-                    if state:
-                        control_info["state"] = state
-                    if value:
-                        control_info["value"] = value
+                    control_info = Control(
+                        name=display_name,
+                        type=control_type,
+                        clickable=clickable,
+                        state=state or None,
+                        value=value or None
+                    )
 
                     # Include controls with names OR important unnamed controls (ToggleButton, CheckBox)
                     if (name and name.strip()) or control_type in ["ToggleButton", "CheckBox"]:
                         controls.append(control_info)
+                        if limit is not None and len(controls) >= limit:
+                            log.debug(f"[GUI INTROSPECT] Hit control limit ({limit}), stopping walk")
+                            break
 
                 except Exception as e:
                     continue
 
         except Exception as e:
-            print(f"[GUI INTROSPECT] Error enumerating controls: {e}", file=sys.stderr)
+            log.warning(f"[GUI INTROSPECT] Error enumerating controls: {e}")
 
-        print(f"[GUI INTROSPECT] Found {len(controls)} controls", file=sys.stderr)
+        log.debug(f"[GUI INTROSPECT] Found {len(controls)} controls")
 
-        # Print summary for debugging
-        for ctrl in controls[:20]:  # First 20 controls
-            state_str = f" ({ctrl.get('state', '')})" if 'state' in ctrl else ""
-            print(f"[GUI INTROSPECT]   - {ctrl['type']}: '{ctrl['name']}'{state_str}", file=sys.stderr)
+        # Log summary for debugging (guarded so the strings aren't even
+        # formatted when debug logging is off)
+        if log.isEnabledFor(logging.DEBUG):
+            for ctrl in controls[:20]:  # First 20 controls
+                state_str = f" ({ctrl.state})" if ctrl.state else ""
+                log.debug(f"[GUI INTROSPECT]   - {ctrl.type}: '{ctrl.name}'{state_str}")
 
-        return {
+        result = {
             "success": True,
             "window": window_title,
             "controls": controls,
             "strategy": f"Introspected {len(controls)} controls in '{window_title}'"
         }
+        if fingerprint is not None:
+            self._ui_cache[fingerprint] = (time.monotonic(), result)
+        return result
 
     def execute_ui_action(self, window_search_terms: List[str], element_name: str,
                          action_type: str, value: any = None) -> str:
@@ -642,7 +1105,10 @@ class GUIActions:
         Returns:
             Success message
         """
-        print(f"[GUI EXECUTE] Action: {action_type} on '{element_name}' (value={value})", file=sys.stderr)
+        log.debug(f"[GUI EXECUTE] Action: {action_type} on '{element_name}' (value={value})")
+
+        # Any executed action mutates the UI, so cached snapshots are stale
+        self._ui_cache.clear()
 
         # Find the window using professional core
         target_window = self.gui_core.find_window(window_search_terms, timeout=5)
@@ -657,7 +1123,7 @@ class GUIActions:
             raise Exception(f"Could not find control '{element_name}' in window '{target_window.window_text()}'")
 
         control_type = control.element_info.control_type
-        print(f"[GUI EXECUTE] Found {control_type}: '{control.window_text()}'", file=sys.stderr)
+        log.debug(f"[GUI EXECUTE] Found {control_type}: '{control.window_text()}'")
 
         # Execute action based on type using professional core
         if action_type == "click":
@@ -693,6 +1159,59 @@ class GUIActions:
         else:
             raise Exception(f"Unknown action type: {action_type}")
 
+    def _step_search_terms(self, window_search_terms: List[str], step_num: int,
+                           is_settings_operation: bool) -> List[str]:
+        """
+        Decide which window terms a wizard step should search for
+
+        Settings flows stay within the Settings window (then widen to any
+        window once dialogs with unpredictable titles may appear), while
+        install/uninstall flows look for popup wizard windows. The settings
+        detection is computed once per goal by the caller - goal and terms
+        never change across the step loop.
+        """
+        if step_num == 0:
+            # First step: use the original window search terms
+            return window_search_terms
+
+        if is_settings_operation:
+            if step_num > 1:
+                # After initial navigation, match ANY non-excluded window -
+                # new dialogs can open with unpredictable titles
+                log.debug(f"[AI GUIDED] 🎯 Settings operation (step {step_num + 1}) - matching any window")
+                return [""]
+            # First navigation step: use original window search terms
+            log.debug(f"[AI GUIDED] 🎯 Settings operation (step {step_num + 1}) - using: {window_search_terms}")
+            return window_search_terms
+
+        # Wizard/Dialog flow: Look for popup windows
+        log.debug(f"[AI GUIDED] 📦 Wizard/Dialog flow detected - looking for popup windows")
+        return ["", "wizard", "install", "uninstall", "setup", "dialog"]
+
+    def _introspect_in_thread(self, search_terms: List[str], settle: float) -> Dict:
+        """
+        Run introspect_ui on a pool thread with its own COM init
+
+        Sleeps for `settle` first so the walk sees the UI after it has had
+        time to react to the action that triggered the prefetch.
+        """
+        com = None
+        try:
+            import comtypes
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+            com = comtypes
+        except Exception:
+            pass
+        try:
+            time.sleep(settle)
+            return self.introspect_ui(search_terms, None)
+        finally:
+            if com is not None:
+                try:
+                    com.CoUninitialize()
+                except Exception:
+                    pass
+
     def ai_guided_navigation(self, goal: str, window_search_terms: List[str],
                             open_command: str = None, max_attempts: int = 3,
                             multi_step: bool = True) -> str:
@@ -711,98 +1230,97 @@ class GUIActions:
         Returns:
             Success message
         """
-        import os
-        from openai import OpenAI
-
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        model = os.getenv('MODEL_NAME', 'gpt-4o-mini')
-
-        print(f"[AI GUIDED] Goal: {goal}", file=sys.stderr)
-        print(f"[AI GUIDED] Multi-step mode: {multi_step}", file=sys.stderr)
-        print(f"[AI GUIDED] Using AI model to analyze and act", file=sys.stderr)
+        client = _get_openai_client()
+        model = _get_model_name()
+
+        log.info(f"[AI GUIDED] Goal: {goal}")
+        log.info(f"[AI GUIDED] Multi-step mode: {multi_step}")
+        log.info(f"[AI GUIDED] Using AI model to analyze and act")
+
+        # Goal and window terms never change across the loop, so the lowered
+        # strings, token set and settings-vs-wizard call are computed once
+        goal_lower = goal.lower()
+        goal_tokens = frozenset(goal_lower.split())
+        search_terms_str = ' '.join(str(t).lower() for t in window_search_terms)
+        is_settings_operation = _SETTINGS_INDICATORS_RE.search(
+            goal_lower + '|' + search_terms_str
+        ) is not None
 
         steps_completed = []
+        # Names of controls already clicked, maintained alongside
+        # steps_completed instead of re-parsed out of it every iteration
+        clicked_elements = set()
         max_steps = 10 if multi_step else 1  # Limit wizard steps to prevent infinite loops
+        # (terms, future) for the UI snapshot prefetched during the previous
+        # step's settle wait, so the next walk overlaps the sleep
+        prefetch = None
 
         for step_num in range(max_steps):
             if step_num > 0 and not multi_step:
                 break  # Single-step mode
 
-            print(f"\n[AI GUIDED] === Step {step_num + 1}/{max_steps} ===", file=sys.stderr)
+            log.info(f"\n[AI GUIDED] === Step {step_num + 1}/{max_steps} ===")
 
             for attempt in range(max_attempts):
-                print(f"[AI GUIDED] Attempt {attempt + 1}/{max_attempts}", file=sys.stderr)
+                log.debug(f"[AI GUIDED] Attempt {attempt + 1}/{max_attempts}")
 
                 # Step 1: Introspect UI
                 # DYNAMIC FIX: Detect Settings vs Wizard flows automatically
                 # Settings: Stay in Settings window, navigate within it
                 # Wizard: Look for dialog windows that appear during installation
 
-                if step_num == 0:
-                    # First step: use the original window search terms
-                    search_terms = window_search_terms
-                else:
-                    # CRITICAL FIX: Detect if this is Settings navigation
-                    # Check if goal OR window_search_terms mention Settings-related operations
-                    goal_lower = goal.lower()
-                    search_terms_str = ' '.join([str(t).lower() for t in window_search_terms])
-
-                    # Settings-related keywords
-                    settings_indicators = [
-                        'settings', 'firewall', 'bluetooth', 'wifi', 'network', 'defender',
-                        'display', 'sound', 'privacy', 'update', 'storage', 'personalization',
-                        'system', 'turn off', 'turn on', 'enable', 'disable', 'toggle'
-                    ]
-
-                    # Check if this is a Settings operation
-                    is_settings_operation = any(
-                        indicator in goal_lower or indicator in search_terms_str
-                        for indicator in settings_indicators
-                    )
-
-                    if is_settings_operation:
-                        # Settings flow: Dynamic window matching
-                        # Step 1: Use original search terms to find main Settings window
-                        # Step 2+: Match ANY window (to handle new dialogs like "Customize Settings")
-                        if step_num > 1:
-                            # After initial navigation, match ANY non-excluded window
-                            # This handles cases where new dialogs open with unpredictable titles
-                            search_terms = [""]
-                            print(f"[AI GUIDED] 🎯 Settings operation (step {step_num + 1}) - matching any window", file=sys.stderr)
-                        else:
-                            # First navigation step: use original window search terms
-                            search_terms = window_search_terms
-                            print(f"[AI GUIDED] 🎯 Settings operation (step {step_num + 1}) - using: {search_terms}", file=sys.stderr)
-                    else:
-                        # Wizard/Dialog flow: Look for popup windows
-                        search_terms = ["", "wizard", "install", "uninstall", "setup", "dialog"]
-                        print(f"[AI GUIDED] 📦 Wizard/Dialog flow detected - looking for popup windows", file=sys.stderr)
-
-                ui_info = self.introspect_ui(search_terms, open_command if step_num == 0 and attempt == 0 else None)
+                search_terms = self._step_search_terms(window_search_terms, step_num, is_settings_operation)
+
+                # Consume the snapshot prefetched during the previous step's
+                # settle wait when it targeted the same terms; retries and
+                # term changes fall through to a fresh walk
+                ui_info = None
+                if prefetch is not None:
+                    prefetch_terms, prefetch_future = prefetch
+                    prefetch = None
+                    if attempt == 0 and prefetch_terms == tuple(search_terms):
+                        try:
+                            ui_info = prefetch_future.result(timeout=5)
+                        except Exception as e:
+                            log.debug(f"[AI GUIDED] Prefetched snapshot unavailable: {e}")
+                            ui_info = None
+                if ui_info is None:
+                    ui_info = self.introspect_ui(search_terms, open_command if step_num == 0 and attempt == 0 else None)
 
                 if not ui_info["success"]:
                     if attempt == max_attempts - 1:
                         # If we're past step 0, goal might be complete
                         if step_num > 0:
-                            print(f"[AI GUIDED] No more windows found - assuming goal complete", file=sys.stderr)
+                            log.debug(f"[AI GUIDED] No more windows found - assuming goal complete")
                             return f"Goal achieved after {step_num} steps: {', '.join(steps_completed)}"
                         raise Exception(f"Failed to find window: {ui_info.get('error')}")
-                    time.sleep(1)
+                    # Back off per attempt instead of a flat second - the
+                    # first retry usually just needs the window to finish
+                    # painting
+                    time.sleep(min(0.25 * (2 ** attempt), 1.0))
                     continue
 
-                # Step 2: Filter out already-clicked controls
-                clicked_elements = set()
-                for step in steps_completed:
-                    # Extract element name from "Clicked 'ElementName'" format
-                    if "Clicked '" in step:
-                        elem_name = step.split("Clicked '")[1].split("'")[0]
-                        clicked_elements.add(elem_name)
+                # Step 2: Filter out already-clicked controls; nothing to
+                # filter (and no copy needed) on the first step
+                if clicked_elements:
+                    available_controls = [
+                        ctrl for ctrl in ui_info['controls']
+                        if ctrl.name not in clicked_elements
+                    ]
+                else:
+                    available_controls = ui_info['controls']
+
+                # Keep the prompt bounded on control-dense windows: score by
+                # type weight plus goal-keyword hits and take the top slice
+                if len(available_controls) > _PROMPT_CONTROL_LIMIT:
+                    available_controls = heapq.nlargest(
+                        _PROMPT_CONTROL_LIMIT, available_controls,
+                        key=lambda ctrl: _score_control(ctrl, goal_tokens)
+                    )
 
-                # Remove already-clicked controls from the list
-                available_controls = [
-                    ctrl for ctrl in ui_info['controls']
-                    if ctrl['name'] not in clicked_elements
-                ]
+                # One dict conversion feeds both the prompt and the
+                # decision-cache key
+                controls_payload = [ctrl.to_dict() for ctrl in available_controls]
 
                 steps_context = f"Steps completed so far: {steps_completed}" if steps_completed else "This is the first step"
                 ai_prompt = f"""You are analyzing a Windows UI to achieve this goal: "{goal}"
@@ -812,7 +1330,7 @@ class GUIActions:
 Window: {ui_info['window']}
 
 Available controls (already-clicked elements have been removed):
-{json.dumps(available_controls, indent=2)}
+{json.dumps(controls_payload, indent=2)}
 
 CRITICAL RULES:
 1. For "turn on/off" goals: Look for controls with type "ToggleButton" or "Button" with state "Off"/"On"
@@ -848,27 +1366,44 @@ If you cannot find the right control, respond with:
 """
 
                 try:
-                    response = client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": "You are a Windows UI automation expert. Analyze UI and decide the NEXT action in a multi-step process."},
-                            {"role": "user", "content": ai_prompt}
-                        ],
-                        temperature=0.1,
-                        max_tokens=500
-                    )
-
-                    ai_decision = response.choices[0].message.content.strip()
-
-                    # Parse AI response
-                    if ai_decision.startswith('```'):
-                        ai_decision = ai_decision.strip('`').strip()
-                        if ai_decision.startswith('json'):
-                            ai_decision = ai_decision[4:].strip()
-
-                    decision = json.loads(ai_decision)
-
-                    print(f"[AI GUIDED] AI Decision: {json.dumps(decision, indent=2)}", file=sys.stderr)
+                    # Same goal + identical UI state means the model would
+                    # see the same prompt - reuse its previous decision
+                    # instead of paying another LLM round-trip
+                    import hashlib
+                    cache_key = hashlib.sha1(
+                        (goal + "|" + json.dumps(controls_payload, sort_keys=True, default=str)).encode()
+                    ).hexdigest()
+
+                    decision = self._decision_cache.get(cache_key)
+                    if decision is not None and decision.get("element_name") in clicked_elements:
+                        # Replaying this choice would click the same element
+                        # again - drop it and ask the model fresh
+                        del self._decision_cache[cache_key]
+                        decision = None
+
+                    if decision is not None:
+                        log.debug(f"[AI GUIDED] Reusing cached decision for identical UI state")
+                    else:
+                        response = client.chat.completions.create(
+                            model=model,
+                            messages=[
+                                {"role": "system", "content": _AI_NAV_SYSTEM_PROMPT},
+                                {"role": "user", "content": ai_prompt}
+                            ],
+                            temperature=0.1,
+                            max_tokens=500
+                        )
+
+                        ai_decision = response.choices[0].message.content.strip()
+
+                        # Parse AI response: lift the JSON blob out of any
+                        # code fences in one scan and hand it to the fast
+                        # parser
+                        blob = _JSON_BLOB_RE.search(ai_decision)
+                        decision = _json_loads(blob.group(0) if blob else ai_decision)
+                        self._decision_cache[cache_key] = decision
+
+                    log.debug(f"[AI GUIDED] AI Decision: {json.dumps(decision, indent=2)}")
 
                     # Check status
                     if decision.get("status") == "complete":
@@ -892,28 +1427,36 @@ If you cannot find the right control, respond with:
 
                     step_description = f"Clicked '{decision['element_name']}'"
                     steps_completed.append(step_description)
-                    print(f"[AI GUIDED] ✓ Step {step_num + 1}: {step_description}", file=sys.stderr)
-
-                    # Wait for next window/dialog to appear
+                    clicked_elements.add(decision['element_name'])
+                    log.debug(f"[AI GUIDED] ✓ Step {step_num + 1}: {step_description}")
+
+                    # Wait for next window/dialog to appear; the next step's
+                    # UIA walk runs on the pool during the tail of this wait
+                    # so its latency hides behind the settle time
+                    next_terms = self._step_search_terms(window_search_terms, step_num + 1, is_settings_operation)
+                    prefetch = (
+                        tuple(next_terms),
+                        self._io_pool.submit(self._introspect_in_thread, next_terms, 1.2),
+                    )
                     time.sleep(2)
 
                     # Break attempt loop, continue to next step
                     break
 
                 except json.JSONDecodeError as e:
-                    print(f"[AI GUIDED] Failed to parse AI response: {e}", file=sys.stderr)
+                    log.warning(f"[AI GUIDED] Failed to parse AI response: {e}")
                     if attempt == max_attempts - 1:
                         raise Exception(f"AI returned invalid response: {ai_decision[:200]}")
                     continue
 
                 except Exception as e:
-                    print(f"[AI GUIDED] Error: {e}", file=sys.stderr)
+                    log.warning(f"[AI GUIDED] Error: {e}")
                     if attempt == max_attempts - 1:
                         if step_num > 0:
                             # Might be done
                             return f"Goal completed after {len(steps_completed)} steps: {', '.join(steps_completed)}"
                         raise
-                    time.sleep(1)
+                    time.sleep(min(0.25 * (2 ** attempt), 1.0))
                     continue
 
         # Completed all steps
@@ -3,6 +3,7 @@ Professional GUI Automation Core using pywinauto
 Systematic, accurate automation for ALL Windows operations
 """
 
+import re
 import sys
 import time
 import platform
@@ -36,6 +37,40 @@ class WindowsGUIAutomation:
         else:
             return f"Windows {release}"
 
+    @staticmethod
+    def _enum_top_windows() -> List[tuple]:
+        """
+        List visible top-level windows as (hwnd, title) via raw Win32
+
+        EnumWindows + GetWindowTextW read a title in microseconds, versus
+        milliseconds for a UIA-wrapped window_text(), so the wait loop can
+        scan every title cheaply and pay for UIA wrapping only on a match.
+        """
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        results = []
+
+        @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        def _collect(hwnd, _lparam):
+            if user32.IsWindowVisible(hwnd):
+                length = user32.GetWindowTextLengthW(hwnd)
+                if length > 0:
+                    buffer = ctypes.create_unicode_buffer(length + 1)
+                    user32.GetWindowTextW(hwnd, buffer, length + 1)
+                    results.append((hwnd, buffer.value))
+            return True
+
+        user32.EnumWindows(_collect, 0)
+        return results
+
+    @staticmethod
+    def _wrap_handle(hwnd: int) -> Any:
+        """Attach pywinauto's UIA wrapper to a bare HWND"""
+        app = Application(backend="uia").connect(handle=hwnd)
+        return app.window(handle=hwnd).wrapper_object()
+
     def find_window(self, search_terms: List[str], timeout: int = 5, debug: bool = True) -> Optional[Any]:
         """
         Find a window by searching for titles containing search terms
@@ -51,52 +86,61 @@ class WindowsGUIAutomation:
         """
         print(f"[GUI CORE] Searching for window with terms: {search_terms}", file=sys.stderr)
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        interval = 0.05
         all_window_titles = set()  # Collect all seen window titles for debugging
 
         # Windows to exclude from search (system windows that shouldn't be interacted with)
         excluded_windows = ["Taskbar", "Program Manager", "Start", ""]
 
-        while time.time() - start_time < timeout:
+        while True:
+            # Enumerate titles through raw Win32 first; UIA wrapping only
+            # happens for the single window that actually matches
             try:
-                windows = self.desktop.windows()
-
-                # First pass: Look for exact matches (excluding system windows)
-                for window in windows:
-                    try:
-                        title = window.window_text()
-
-                        # Skip empty titles
-                        if not title or not title.strip():
-                            continue
-
-                        # Skip excluded system windows
-                        if title in excluded_windows:
-                            continue
-
-                        # Collect for debugging
-                        if title not in all_window_titles:
-                            all_window_titles.add(title)
-
-                        # Check if any search term matches the title
-                        for term in search_terms:
-                            # Empty term matches any window (but not excluded ones)
-                            if not term:
-                                if title not in excluded_windows:
-                                    print(f"[GUI CORE] Found window (fallback): '{title}'", file=sys.stderr)
-                                    return window
-                            # Exact or partial match
-                            elif term.lower() in title.lower():
-                                print(f"[GUI CORE] Found window: '{title}' (matched '{term}')", file=sys.stderr)
-                                return window
-
-                    except Exception:
-                        continue
-
+                candidates = self._enum_top_windows()
+                raw = True
             except Exception as e:
-                print(f"[GUI CORE] Search error: {e}", file=sys.stderr)
-
-            time.sleep(0.5)
+                print(f"[GUI CORE] Raw enumeration failed ({e}), using UIA scan", file=sys.stderr)
+                raw = False
+                candidates = []
+                try:
+                    for window in self.desktop.windows():
+                        try:
+                            candidates.append((window, window.window_text()))
+                        except Exception:
+                            continue
+                except Exception as e:
+                    print(f"[GUI CORE] Search error: {e}", file=sys.stderr)
+
+            for handle, title in candidates:
+                # Skip empty titles
+                if not title or not title.strip():
+                    continue
+
+                # Skip excluded system windows
+                if title in excluded_windows:
+                    continue
+
+                # Collect for debugging
+                if title not in all_window_titles:
+                    all_window_titles.add(title)
+
+                # Check if any search term matches the title
+                for term in search_terms:
+                    # Empty term matches any window (but not excluded ones)
+                    if not term or term.lower() in title.lower():
+                        matched = f"(matched '{term}')" if term else "(fallback)"
+                        print(f"[GUI CORE] Found window: '{title}' {matched}", file=sys.stderr)
+                        try:
+                            return self._wrap_handle(handle) if raw else handle
+                        except Exception as e:
+                            print(f"[GUI CORE] Failed to attach to '{title}': {e}", file=sys.stderr)
+                            break
+
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.4)
 
         # Search failed - provide helpful debugging
         print(f"[GUI CORE] Window not found after {timeout}s", file=sys.stderr)
@@ -131,16 +175,16 @@ class WindowsGUIAutomation:
             if name:
                 try:
                     if partial_match:
-                        # Find controls containing the name
-                        controls = window.descendants(control_type=control_type)
-                        for ctrl in controls:
-                            try:
-                                ctrl_text = ctrl.window_text()
-                                if name.lower() in ctrl_text.lower():
-                                    print(f"[GUI CORE] Found control: '{ctrl_text}'", file=sys.stderr)
-                                    return ctrl
-                            except:
-                                continue
+                        # Push the substring match into pywinauto's single
+                        # find pass instead of walking every descendant and
+                        # reading each title over COM one by one
+                        ctrl = window.child_window(
+                            title_re=f"(?i).*{re.escape(name)}.*",
+                            control_type=control_type,
+                            found_index=0
+                        ).wrapper_object()
+                        print(f"[GUI CORE] Found control: '{ctrl.window_text()}'", file=sys.stderr)
+                        return ctrl
                     else:
                         # Exact match
                         return window.child_window(title=name, control_type=control_type)
@@ -243,17 +287,17 @@ class WindowsGUIAutomation:
         Returns:
             Settings window if found, None otherwise
         """
-        import subprocess
+        import os
 
         try:
             print(f"[GUI CORE] Opening settings: {settings_uri}", file=sys.stderr)
-            subprocess.Popen(f'start {settings_uri}', shell=True)
+            # os.startfile calls ShellExecuteW in-process - no cmd.exe spawn
+            # just to run `start`, and nothing shell-parses the URI
+            os.startfile(settings_uri)
 
-            # Wait for Settings window to appear
-            time.sleep(1.5)
-
-            # Find the Settings window
-            settings_window = self.find_window(["Settings"], timeout=5)
+            # Find the Settings window; find_window polls with backoff, so
+            # no fixed head-start sleep is needed
+            settings_window = self.find_window(["Settings"], timeout=6)
 
             if settings_window:
                 print(f"[GUI CORE] Settings window opened", file=sys.stderr)
@@ -277,33 +321,48 @@ class WindowsGUIAutomation:
         Returns:
             True if all elements clicked successfully, False otherwise
         """
-        current_window = window
+        # Walk the subtree once into a name -> control map; each step then
+        # resolves in memory and the clicks run back-to-back with a single
+        # settle pause at the end, instead of up to three descendants()
+        # walks plus a fixed 0.5s sleep per element
+        controls_by_name = {}
+        try:
+            for ctrl in window.descendants():
+                try:
+                    text = ctrl.window_text()
+                    if text:
+                        controls_by_name.setdefault(text.lower(), ctrl)
+                except Exception:
+                    continue
+        except Exception as e:
+            print(f"[GUI CORE] Failed to enumerate controls: {e}", file=sys.stderr)
+            return False
 
         for element_name in navigation_path:
             print(f"[GUI CORE] Looking for: {element_name}", file=sys.stderr)
 
-            # Find and click the element
-            control = self.find_control(current_window, name=element_name)
-
+            name_lower = element_name.lower()
+            control = controls_by_name.get(name_lower)
             if not control:
-                # Try as button specifically
-                control = self.find_control(current_window, control_type="Button", name=element_name)
+                # Substring match, mirroring find_control's partial matching
+                for text, ctrl in controls_by_name.items():
+                    if name_lower in text:
+                        control = ctrl
+                        break
 
             if not control:
-                # Try as text/hyperlink
-                control = self.find_control(current_window, control_type="Hyperlink", name=element_name)
-
-            if control:
-                if self.click_control(control):
-                    time.sleep(0.5)  # Wait for UI to update
-                    current_window = window  # Continue from same window
-                else:
-                    print(f"[GUI CORE] Failed to click: {element_name}", file=sys.stderr)
-                    return False
-            else:
                 print(f"[GUI CORE] Element not found: {element_name}", file=sys.stderr)
                 return False
 
+            try:
+                control.click_input()
+                print(f"[GUI CORE] Clicked: {element_name}", file=sys.stderr)
+            except Exception as e:
+                print(f"[GUI CORE] Failed to click: {element_name} ({e})", file=sys.stderr)
+                return False
+
+        # One settle pause for the whole batch
+        time.sleep(0.3)
         return True
 
     def get_window_controls_tree(self, window: Any, max_depth: int = 3) -> Dict:
@@ -317,32 +376,48 @@ class WindowsGUIAutomation:
         Returns:
             Dictionary representing the control tree
         """
-        def get_control_info(ctrl, depth=0):
-            if depth > max_depth:
-                return None
+        from collections import deque
+
+        def node_info(element_info):
+            return {
+                "type": element_info.control_type,
+                "name": element_info.name,
+                "auto_id": element_info.automation_id,
+                "class": element_info.class_name,
+                "visible": element_info.visible,
+                "enabled": element_info.enabled
+            }
+
+        # Iterative BFS over element_info with cached child reads: each
+        # children(cache_enable=True) call bulk-fetches the properties for a
+        # whole sibling group in one COM round-trip, instead of five reads
+        # per node from the recursive walk
+        try:
+            root = node_info(window.element_info)
+        except:
+            return None
+
+        queue = deque([(window.element_info, 0, root)])
+        while queue:
+            element_info, depth, entry = queue.popleft()
+            if depth >= max_depth:
+                continue
 
             try:
-                info = {
-                    "type": ctrl.element_info.control_type,
-                    "name": ctrl.window_text(),
-                    "auto_id": ctrl.element_info.automation_id,
-                    "class": ctrl.element_info.class_name,
-                    "visible": ctrl.is_visible(),
-                    "enabled": ctrl.is_enabled()
-                }
-
-                # Get children
-                children = []
-                for child in ctrl.children():
-                    child_info = get_control_info(child, depth + 1)
-                    if child_info:
-                        children.append(child_info)
-
-                if children:
-                    info["children"] = children
-
-                return info
+                child_infos = element_info.children(cache_enable=True)
             except:
-                return None
+                continue
+
+            children = []
+            for child in child_infos:
+                try:
+                    child_entry = node_info(child)
+                except:
+                    continue
+                children.append(child_entry)
+                queue.append((child, depth + 1, child_entry))
+
+            if children:
+                entry["children"] = children
 
-        return get_control_info(window)
+        return root
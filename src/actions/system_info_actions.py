@@ -3,17 +3,75 @@ System Information Actions
 Handles queries about system status, processes, hardware, etc.
 """
 
+import functools
+import heapq
 import psutil
 import platform
+import threading
+import time
 from typing import Dict, List
 
+# Process-list snapshot shared across calls - consecutive queries within
+# one agent turn reuse it instead of repeating the kernel process walk
+_PROC_SNAPSHOT = None
+_PROC_SNAPSHOT_LOCK = threading.Lock()
+_PROC_SNAPSHOT_TTL = 1.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_platform_info() -> Dict:
+    """OS/CPU identity never changes in-process, so read it once"""
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'os_release': platform.release(),
+        'architecture': platform.machine(),
+        'processor': platform.processor(),
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _disk_usage_cached(path: str, bucket: int):
+    """
+    disk_usage keyed by path plus a 0.5s time bucket
+
+    Back-to-back queries for the same path within half a second reuse one
+    syscall; the bucket argument rolls over naturally so results never go
+    meaningfully stale.
+    """
+    return psutil.disk_usage(path)
+
+
+def _get_proc_snapshot(ttl: float = _PROC_SNAPSHOT_TTL) -> List[Dict]:
+    """
+    Return the recent process info list, re-walking only after the TTL
+
+    The enumeration itself dominates process queries, so a short-lived
+    snapshot lets back-to-back calls (top-by-memory plus a follow-up)
+    share one walk without serving meaningfully stale data.
+    """
+    global _PROC_SNAPSHOT
+    now = time.monotonic()
+    with _PROC_SNAPSHOT_LOCK:
+        if _PROC_SNAPSHOT is not None and now - _PROC_SNAPSHOT[0] < ttl:
+            return _PROC_SNAPSHOT[1]
+
+        snapshot = [
+            proc.info
+            for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'memory_info'])
+        ]
+        _PROC_SNAPSHOT = (now, snapshot)
+        return snapshot
+
 
 class SystemInfoActions:
     """Handles system information queries"""
 
     def __init__(self):
         """Initialize system info actions"""
-        pass
+        # Prime the CPU counter so later non-blocking cpu_percent() calls
+        # return the utilization since the previous query instead of 0.0
+        psutil.cpu_percent(interval=None)
 
     def get_top_processes_by_memory(self, limit: int = 5, exclude_fields: list = None) -> Dict:
         """
@@ -26,52 +84,41 @@ class SystemInfoActions:
         Returns:
             Dictionary with top processes information
         """
-        processes = []
         exclude_fields = exclude_fields or []
 
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'memory_info']):
-                try:
-                    pinfo = proc.info
-                    memory_mb = pinfo['memory_info'].rss / (1024 * 1024)  # Convert to MB
-                    memory_percent = pinfo['memory_percent'] or 0
-
-                    # Build process dict dynamically based on exclusions
-                    proc_data = {}
-                    proc_data['name'] = pinfo['name']  # Always include name
-
-                    if 'pid' not in exclude_fields:
-                        proc_data['pid'] = pinfo['pid']
-                    if 'memory_mb' not in exclude_fields:
-                        proc_data['memory_mb'] = round(memory_mb, 2)
-                    if 'memory_percent' not in exclude_fields:
-                        proc_data['memory_percent'] = round(memory_percent, 2)
-
-                    # Store raw memory_mb for sorting even if excluded
-                    if 'memory_mb' not in proc_data:
-                        proc_data['_memory_mb_for_sort'] = round(memory_mb, 2)
-
-                    processes.append(proc_data)
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            # Sort by memory (use _memory_mb_for_sort if memory_mb is excluded)
-            processes.sort(
-                key=lambda x: x.get('memory_mb', x.get('_memory_mb_for_sort', 0)),
-                reverse=True
+            # Partial selection instead of a full sort: O(N log limit) over
+            # (rss, info) pairs, and only the winners get formatted into
+            # result dicts
+            snapshot = _get_proc_snapshot()
+            candidates = (
+                (pinfo['memory_info'].rss, pinfo)
+                for pinfo in snapshot
+                if pinfo.get('memory_info')
             )
+            top = heapq.nlargest(limit, candidates, key=lambda item: item[0])
+
+            top_processes = []
+            for rss, pinfo in top:
+                memory_mb = rss / (1024 * 1024)  # Convert to MB
+                memory_percent = pinfo['memory_percent'] or 0
+
+                # Build process dict dynamically based on exclusions
+                proc_data = {}
+                proc_data['name'] = pinfo['name']  # Always include name
 
-            # Remove the sort helper field
-            for proc in processes:
-                proc.pop('_memory_mb_for_sort', None)
+                if 'pid' not in exclude_fields:
+                    proc_data['pid'] = pinfo['pid']
+                if 'memory_mb' not in exclude_fields:
+                    proc_data['memory_mb'] = round(memory_mb, 2)
+                if 'memory_percent' not in exclude_fields:
+                    proc_data['memory_percent'] = round(memory_percent, 2)
 
-            # Get top N
-            top_processes = processes[:limit]
+                top_processes.append(proc_data)
 
             return {
                 'top_processes': top_processes,
-                'total_processes': len(processes),
+                'total_processes': len(snapshot),
                 'limit': limit
             }
 
@@ -86,18 +133,21 @@ class SystemInfoActions:
             Dictionary with system information
         """
         try:
-            return {
-                'os': platform.system(),
-                'os_version': platform.version(),
-                'os_release': platform.release(),
-                'architecture': platform.machine(),
-                'processor': platform.processor(),
+            # Non-blocking CPU sample: the counter is primed in __init__, so
+            # interval=None reports usage since the last query without the
+            # one-second blocking sleep of interval=1
+            # One virtual_memory() call instead of three - each one is a
+            # separate GlobalMemoryStatusEx syscall
+            vm = psutil.virtual_memory()
+            info = dict(_get_platform_info())
+            info.update({
                 'cpu_count': psutil.cpu_count(),
-                'cpu_percent': psutil.cpu_percent(interval=1),
-                'memory_total_gb': round(psutil.virtual_memory().total / (1024**3), 2),
-                'memory_used_gb': round(psutil.virtual_memory().used / (1024**3), 2),
-                'memory_percent': psutil.virtual_memory().percent
-            }
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory_total_gb': round(vm.total / (1024**3), 2),
+                'memory_used_gb': round(vm.used / (1024**3), 2),
+                'memory_percent': vm.percent
+            })
+            return info
         except Exception as e:
             raise Exception(f"Failed to get system information: {str(e)}")
 
@@ -112,7 +162,7 @@ class SystemInfoActions:
             Dictionary with disk usage information
         """
         try:
-            usage = psutil.disk_usage(path)
+            usage = _disk_usage_cached(path, int(time.time() // 0.5))
             return {
                 'path': path,
                 'total_gb': round(usage.total / (1024**3), 2),
@@ -17,6 +17,7 @@ from planner import Planner
 from validator import Validator
 from executor import Executor
 from logger import AuditLogger
+from utils import jsonable_fallback
 from admin_utils import is_admin, prompt_for_admin
 
 
@@ -209,8 +210,9 @@ def main():
             'error': 'No valid operation specified'
         }
 
-    # Output JSON result
-    print(json.dumps(result, indent=2))
+    # Output JSON result; action outputs may carry objects like Control
+    # that need the to_dict()/str fallback
+    print(json.dumps(result, indent=2, default=jsonable_fallback))
 
 
 if __name__ == '__main__':
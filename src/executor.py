@@ -95,6 +95,14 @@ class Executor:
         import json
         import re
 
+        def traverse(value, part):
+            """Subscript dicts/lists; fall back to attribute access for
+            objects like the Control dataclass"""
+            try:
+                return value[part]
+            except TypeError:
+                return getattr(value, part)
+
         # Work directly with the dict to avoid JSON escaping issues
         def resolve_value(value, previous_results):
             """Recursively resolve references in any value"""
@@ -118,10 +126,10 @@ class Executor:
                                 if '[' in part and ']' in part:
                                     key = part.split('[')[0]
                                     index = int(part.split('[')[1].split(']')[0])
-                                    resolved_value = resolved_value[key][index] if key else resolved_value[index]
+                                    resolved_value = traverse(resolved_value, key)[index] if key else resolved_value[index]
                                 else:
-                                    resolved_value = resolved_value[part]
-                        except (KeyError, IndexError, TypeError):
+                                    resolved_value = traverse(resolved_value, part)
+                        except (KeyError, IndexError, TypeError, AttributeError):
                             return match.group(0)
 
                     return str(resolved_value) if resolved_value is not None else match.group(0)
@@ -9,6 +9,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from utils import jsonable_fallback
+
 
 class AuditLogger:
     """Logs all agent actions to SQLite for audit trail"""
@@ -69,7 +71,9 @@ class AuditLogger:
         timestamp = datetime.now().isoformat()
         user = os.getenv('USERNAME') or os.getenv('USER') or 'unknown'
         args_json = json.dumps(args)
-        output_json = json.dumps(output) if output else None
+        # Action outputs can carry non-dict payloads (e.g. introspected
+        # Control objects); serialize via to_dict()/str rather than failing
+        output_json = json.dumps(output, default=jsonable_fallback) if output else None
 
         cursor.execute('''
             INSERT INTO actions (timestamp, action, args, status, output, error, user)
@@ -2,15 +2,21 @@
 Utility functions for Desktop Automation Agent
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=256)
 def expand_path(path: str) -> str:
     """
     Expand environment variables and user home directory in paths
 
+    Results are cached - every file action calls this and inputs repeat
+    heavily. Call expand_path.cache_clear() if relevant environment
+    variables change mid-process.
+
     Args:
         path: Path string potentially containing variables
 
@@ -3,6 +3,7 @@ Utility modules and functions for Desktop Automation Agent
 Combines admin elevation with general utility functions
 """
 
+import functools
 import os
 from pathlib import Path
 
@@ -11,10 +12,15 @@ from .admin_elevation import AdminElevation, is_admin, require_admin
 
 # General utility functions (from old utils.py for backward compatibility)
 
+@functools.lru_cache(maxsize=256)
 def expand_path(path: str) -> str:
     """
     Expand environment variables and user home directory in paths
 
+    Results are cached - every file action calls this and inputs repeat
+    heavily. Call expand_path.cache_clear() if relevant environment
+    variables change mid-process.
+
     Args:
         path: Path string potentially containing variables
 
@@ -95,6 +101,26 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+def jsonable_fallback(obj):
+    """
+    default= handler for json.dumps on action results
+
+    Action outputs can carry non-dict payloads (e.g. the Control objects
+    returned by introspect_ui); serialize via to_dict()/str instead of
+    raising at the output boundary.
+
+    Args:
+        obj: Object json.dumps could not serialize natively
+
+    Returns:
+        A JSON-serializable representation of the object
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    return str(obj)
+
+
 def confirm_action(prompt: str, default: bool = False) -> bool:
     """
     Ask user for confirmation
@@ -125,5 +151,6 @@ __all__ = [
     'get_file_size_human',
     'is_safe_path',
     'sanitize_filename',
+    'jsonable_fallback',
     'confirm_action'
 ]